@@ -0,0 +1,50 @@
+"""Composite (character_id, created_at DESC) indexes for generation tables
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listing/polling generations by character ordered by recency should be
+    # an index-ordered scan instead of an index lookup plus sort.
+    op.create_index(
+        "ix_image_generations_character_created",
+        "image_generations",
+        ["character_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_video_generations_character_created",
+        "video_generations",
+        ["character_id", sa.text("created_at DESC")],
+    )
+
+    # The composite indexes cover plain character_id lookups too
+    op.drop_index("ix_image_generations_character_id", table_name="image_generations")
+    op.drop_index("ix_video_generations_character_id", table_name="video_generations")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_image_generations_character_id", "image_generations", ["character_id"]
+    )
+    op.create_index(
+        "ix_video_generations_character_id", "video_generations", ["character_id"]
+    )
+    op.drop_index(
+        "ix_image_generations_character_created", table_name="image_generations"
+    )
+    op.drop_index(
+        "ix_video_generations_character_created", table_name="video_generations"
+    )
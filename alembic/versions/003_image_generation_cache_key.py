@@ -0,0 +1,36 @@
+"""cache_key column and lookup index for image generation result reuse
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-02-02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "image_generations",
+        sa.Column("cache_key", sa.String(length=32), nullable=True),
+    )
+    op.create_index(
+        "ix_image_generations_character_cache_key",
+        "image_generations",
+        ["character_id", "cache_key"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_image_generations_character_cache_key",
+        table_name="image_generations",
+    )
+    op.drop_column("image_generations", "cache_key")
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Production server entrypoint.
+
+Runs uvicorn with the uvloop event loop and httptools HTTP parser
+(C implementations of the selector loop and h11 parser), which matters
+for the many small 202-returning requests the generation endpoints serve.
+
+Usage:
+    python run.py
+    API_WORKERS=4 python run.py
+"""
+
+import uvicorn
+
+from src.core.config import get_settings
+
+
+def main() -> None:
+    settings = get_settings()
+    uvicorn.run(
+        "src.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.api_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
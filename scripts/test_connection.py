@@ -21,23 +21,22 @@ import httpx
 from dotenv import load_dotenv
 
 
-async def test_comfyui_direct(url: str) -> bool:
+async def test_comfyui_direct(client: httpx.AsyncClient, url: str) -> bool:
     """Test direct connection to ComfyUI."""
     print(f"\n[1] Testing direct ComfyUI connection: {url}")
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            # Test system stats endpoint
-            response = await client.get(f"{url}/system_stats")
-            if response.status_code == 200:
-                stats = response.json()
-                print(f"    ✓ ComfyUI is running")
-                print(f"    ✓ GPU: {stats.get('devices', [{}])[0].get('name', 'Unknown')}")
-                print(f"    ✓ VRAM: {stats.get('devices', [{}])[0].get('vram_total', 0) / 1e9:.1f} GB")
-                return True
-            else:
-                print(f"    ✗ Unexpected status: {response.status_code}")
-                return False
+        # Test system stats endpoint
+        response = await client.get(f"{url}/system_stats")
+        if response.status_code == 200:
+            stats = response.json()
+            print(f"    ✓ ComfyUI is running")
+            print(f"    ✓ GPU: {stats.get('devices', [{}])[0].get('name', 'Unknown')}")
+            print(f"    ✓ VRAM: {stats.get('devices', [{}])[0].get('vram_total', 0) / 1e9:.1f} GB")
+            return True
+        else:
+            print(f"    ✗ Unexpected status: {response.status_code}")
+            return False
     except httpx.ConnectError:
         print(f"    ✗ Connection refused - is the pod running?")
         return False
@@ -49,50 +48,49 @@ async def test_comfyui_direct(url: str) -> bool:
         return False
 
 
-async def test_models(url: str) -> bool:
+async def test_models(client: httpx.AsyncClient, url: str) -> bool:
     """Check if required models are installed."""
     print(f"\n[2] Checking installed models...")
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(f"{url}/object_info")
-            if response.status_code != 200:
-                print(f"    ✗ Could not fetch object info")
-                return False
-
-            # Check for required node types
-            info = response.json()
-            required_nodes = [
-                "CheckpointLoaderSimple",
-                "KSampler",
-                "CLIPTextEncode",
-                "LoraLoader",
-                "VAEDecode",
-                "SaveImage",
-            ]
-
-            missing = []
-            for node in required_nodes:
-                if node in info:
-                    print(f"    ✓ {node}")
-                else:
-                    print(f"    ✗ {node} - MISSING")
-                    missing.append(node)
-
-            # Check for video nodes
-            if "VHS_VideoCombine" in info:
-                print(f"    ✓ VHS_VideoCombine (VideoHelperSuite)")
+        response = await client.get(f"{url}/object_info")
+        if response.status_code != 200:
+            print(f"    ✗ Could not fetch object info")
+            return False
+
+        # Check for required node types
+        info = response.json()
+        required_nodes = [
+            "CheckpointLoaderSimple",
+            "KSampler",
+            "CLIPTextEncode",
+            "LoraLoader",
+            "VAEDecode",
+            "SaveImage",
+        ]
+
+        missing = []
+        for node in required_nodes:
+            if node in info:
+                print(f"    ✓ {node}")
             else:
-                print(f"    ⚠ VHS_VideoCombine - not installed (video gen won't work)")
+                print(f"    ✗ {node} - MISSING")
+                missing.append(node)
+
+        # Check for video nodes
+        if "VHS_VideoCombine" in info:
+            print(f"    ✓ VHS_VideoCombine (VideoHelperSuite)")
+        else:
+            print(f"    ⚠ VHS_VideoCombine - not installed (video gen won't work)")
 
-            return len(missing) == 0
+        return len(missing) == 0
 
     except Exception as e:
         print(f"    ✗ Error checking models: {e}")
         return False
 
 
-async def test_runpod_api(api_key: str) -> bool:
+async def test_runpod_api(client: httpx.AsyncClient, api_key: str) -> bool:
     """Test RunPod API connection."""
     print(f"\n[3] Testing RunPod API...")
 
@@ -101,30 +99,29 @@ async def test_runpod_api(api_key: str) -> bool:
         return True
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                "https://api.runpod.io/graphql",
-                json={
-                    "query": "query { myself { id email pods { id name } } }"
-                },
-                headers={"Authorization": f"Bearer {api_key}"}
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if "data" in data and "myself" in data["data"]:
-                    pods = data["data"]["myself"].get("pods", [])
-                    print(f"    ✓ RunPod API connected")
-                    print(f"    ✓ Found {len(pods)} pod(s)")
-                    for pod in pods:
-                        print(f"       - {pod['name']} ({pod['id']})")
-                    return True
-                else:
-                    print(f"    ✗ Invalid API response")
-                    return False
+        response = await client.post(
+            "https://api.runpod.io/graphql",
+            json={
+                "query": "query { myself { id email pods { id name } } }"
+            },
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if "data" in data and "myself" in data["data"]:
+                pods = data["data"]["myself"].get("pods", [])
+                print(f"    ✓ RunPod API connected")
+                print(f"    ✓ Found {len(pods)} pod(s)")
+                for pod in pods:
+                    print(f"       - {pod['name']} ({pod['id']})")
+                return True
             else:
-                print(f"    ✗ API returned status {response.status_code}")
+                print(f"    ✗ Invalid API response")
                 return False
+        else:
+            print(f"    ✗ API returned status {response.status_code}")
+            return False
 
     except Exception as e:
         print(f"    ✗ Error: {e}")
@@ -146,15 +143,21 @@ async def main():
     print("Character Generation API - Connection Test")
     print("=" * 50)
 
-    # Run tests
+    # Run tests over one keep-alive client so the probes share a connection
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=10)
+    # Granular timeouts: a wall-clock timeout can fire during event-loop
+    # stalls even though the socket answered quickly
+    timeout = httpx.Timeout(connect=10.0, read=30.0, write=30.0, pool=5.0)
+
     results = []
 
-    results.append(await test_comfyui_direct(url))
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout) as client:
+        results.append(await test_comfyui_direct(client, url))
 
-    if results[0]:  # Only test models if connection works
-        results.append(await test_models(url))
+        if results[0]:  # Only test models if connection works
+            results.append(await test_models(client, url))
 
-    results.append(await test_runpod_api(api_key))
+        results.append(await test_runpod_api(client, api_key))
 
     # Summary
     print("\n" + "=" * 50)
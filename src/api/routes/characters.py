@@ -1,9 +1,12 @@
+import asyncio
 import re
+from datetime import datetime
+from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, File, Form
-from sqlalchemy import select, func
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, UploadFile, File, Form
+from sqlalchemy import delete, select, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.core.dependencies import DBSession
 from src.models.character import Character
@@ -11,37 +14,116 @@ from src.schemas.character import (
     CharacterListResponse,
     CharacterResponse,
     CharacterStatus,
+    character_list_adapter,
 )
+from src.services.storage.manager import storage_manager
 from src.services.training.lora_trainer import start_lora_training
 
 router = APIRouter()
 
+CHARACTER_COUNT_KEY = "characters:count"
+CHARACTER_COUNT_TTL = 30  # seconds
+
+_TRIGGER_WORD_RE = re.compile(r"[^a-zA-Z0-9]")
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_IMAGE_BYTES = 20 * 1024 * 1024  # per training image
+
+
+async def get_cached_character_count(request: Request, db) -> int:
+    """Get the total character count, preferring the Redis cache over count(*)."""
+    redis = request.app.state.redis
+    try:
+        cached = await redis.get(CHARACTER_COUNT_KEY)
+        if cached is not None:
+            return int(cached)
+    except Exception:
+        pass  # Redis unavailable - fall back to the database
+
+    total = await db.scalar(select(func.count()).select_from(Character)) or 0
+    try:
+        await redis.set(CHARACTER_COUNT_KEY, total, ex=CHARACTER_COUNT_TTL)
+    except Exception:
+        pass
+    return total
+
+
+async def invalidate_character_count(request: Request) -> None:
+    """Drop the cached character count after a create/delete."""
+    try:
+        await request.app.state.redis.delete(CHARACTER_COUNT_KEY)
+    except Exception:
+        pass
+
 
 def generate_trigger_word(name: str) -> str:
     """Generate a unique trigger word from character name."""
-    clean_name = re.sub(r"[^a-zA-Z0-9]", "", name.lower())
-    return f"sks_{clean_name}"
+    return f"sks_{_TRIGGER_WORD_RE.sub('', name.lower())}"
 
 
-@router.get("", response_model=CharacterListResponse)
-async def list_characters(db: DBSession, skip: int = 0, limit: int = 100):
-    """List all characters."""
-    result = await db.execute(
-        select(Character).order_by(Character.created_at.desc()).offset(skip).limit(limit)
+@router.get("", response_model=None, responses={200: {"model": CharacterListResponse}})
+async def list_characters(
+    request: Request,
+    db: DBSession,
+    cursor: datetime | None = None,
+    cursor_id: UUID | None = None,
+    limit: int = 100,
+):
+    """
+    List characters, newest first.
+
+    Uses keyset pagination: pass the returned next_cursor and
+    next_cursor_id to fetch the following page. Unlike OFFSET, the seek
+    stays O(log n) on deep pages.
+    """
+    # Window-function count returns rows and total in one round-trip.
+    # id breaks created_at ties (rows inserted in one transaction share a
+    # now() timestamp) so the seek never skips boundary rows; uuid7 PKs
+    # sort in insertion order.
+    stmt = (
+        select(Character, func.count().over().label("total"))
+        .order_by(Character.created_at.desc(), Character.id.desc())
+        .limit(limit)
     )
-    characters = result.scalars().all()
+    if cursor is not None:
+        if cursor_id is not None:
+            stmt = stmt.where(
+                tuple_(Character.created_at, Character.id) < (cursor, cursor_id)
+            )
+        else:
+            stmt = stmt.where(Character.created_at < cursor)
 
-    # Efficient count query
-    total = await db.scalar(select(func.count()).select_from(Character)) or 0
+    rows = (await db.execute(stmt)).all()
+    characters = [row[0] for row in rows]
+
+    if cursor is None:
+        total = rows[0].total if rows else 0
+    else:
+        # The window count only covers rows past the cursor
+        total = await get_cached_character_count(request, db)
+
+    if len(characters) == limit:
+        next_cursor = characters[-1].created_at
+        next_cursor_id = characters[-1].id
+    else:
+        next_cursor = None
+        next_cursor_id = None
 
-    return CharacterListResponse(characters=list(characters), total=total)
+    # Validate the page once through the list adapter and dump straight to
+    # JSON-safe primitives, skipping FastAPI's second validation pass
+    validated = character_list_adapter.validate_python(characters, from_attributes=True)
+    return {
+        "characters": character_list_adapter.dump_python(validated, mode="json"),
+        "total": total,
+        "next_cursor": next_cursor,
+        "next_cursor_id": next_cursor_id,
+    }
 
 
 @router.get("/{character_id}", response_model=CharacterResponse)
 async def get_character(character_id: UUID, db: DBSession):
     """Get a character by ID."""
-    result = await db.execute(select(Character).where(Character.id == character_id))
-    character = result.scalar_one_or_none()
+    character = await db.get(Character, character_id)
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -51,6 +133,7 @@ async def get_character(character_id: UUID, db: DBSession):
 
 @router.post("", response_model=CharacterResponse, status_code=201)
 async def create_character(
+    request: Request,
     background_tasks: BackgroundTasks,
     db: DBSession,
     name: str = Form(...),
@@ -81,43 +164,114 @@ async def create_character(
     # Generate trigger word if not provided
     final_trigger_word = trigger_word or generate_trigger_word(name)
 
-    # Create character record
-    character = Character(
-        name=name,
-        description=description,
-        trigger_word=final_trigger_word,
-        status=CharacterStatus.PENDING.value,
+    # Create character record; ON CONFLICT DO NOTHING turns the duplicate
+    # trigger_word case into an empty RETURNING instead of an
+    # IntegrityError rollback
+    stmt = (
+        pg_insert(Character)
+        .values(
+            name=name,
+            description=description,
+            trigger_word=final_trigger_word,
+            status=CharacterStatus.PENDING.value,
+        )
+        .on_conflict_do_nothing(index_elements=["trigger_word"])
+        .returning(Character)
     )
+    character = (await db.execute(stmt)).scalar_one_or_none()
 
-    try:
-        db.add(character)
-        await db.flush()
-        await db.refresh(character)
-    except IntegrityError:
-        await db.rollback()
+    if character is None:
         raise HTTPException(
             status_code=400,
             detail=f"Character with trigger word '{final_trigger_word}' already exists"
         )
 
-    # Start LoRA training in background
-    background_tasks.add_task(
-        start_lora_training,
-        character_id=character.id,
-        images=images,
-    )
+    # Upload training images to storage within the request. FastAPI closes
+    # the UploadFile temp files once the response is sent, so the background
+    # task gets stable storage keys instead of live file handles.
+    key_prefix = f"training/{character.id}"
+    semaphore = asyncio.Semaphore(8)
+    uploaded_keys: list[str] = []
+
+    async def upload_image(index: int, image: UploadFile) -> str:
+        async with semaphore:
+            ext = Path(image.filename or "image.png").suffix or ".png"
+            key = f"{key_prefix}/{index:04d}{ext}"
+
+            # Read in 1 MiB chunks so oversized payloads are rejected
+            # before the whole file is buffered
+            chunks = []
+            size = 0
+            while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_IMAGE_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Image '{image.filename}' exceeds {MAX_IMAGE_BYTES // (1024 * 1024)} MB limit",
+                    )
+                chunks.append(chunk)
+
+            await storage_manager.upload(
+                data=b"".join(chunks),
+                path=key,
+                content_type=image.content_type or "image/png",
+            )
+            uploaded_keys.append(key)
+            return key
+
+    # On any failure, cancel the sibling uploads (they would otherwise
+    # outlive the response and read from closed UploadFiles) and delete
+    # the objects already uploaded for the rolled-back character
+    tasks = [asyncio.create_task(upload_image(i, img)) for i, img in enumerate(images)]
+    try:
+        image_keys = list(await asyncio.gather(*tasks))
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if uploaded_keys:
+            await asyncio.gather(
+                *(storage_manager.delete(key) for key in uploaded_keys),
+                return_exceptions=True,
+            )
+        raise
+    character.training_images_path = key_prefix
+    # Commit before enqueueing: the worker can pick the job up immediately
+    # and must see the character row (get_db only commits after the
+    # response is sent)
+    await db.commit()
+
+    await invalidate_character_count(request)
+
+    # Queue LoRA training on the worker; fall back to an in-process task
+    # when the queue is unavailable (dev without Redis)
+    arq = getattr(request.app.state, "arq", None)
+    if arq is not None:
+        await arq.enqueue_job(
+            "train_lora",
+            character_id=str(character.id),
+            image_keys=image_keys,
+        )
+    else:
+        background_tasks.add_task(
+            start_lora_training,
+            character_id=character.id,
+            image_keys=image_keys,
+        )
 
     return character
 
 
 @router.delete("/{character_id}", status_code=204)
-async def delete_character(character_id: UUID, db: DBSession):
+async def delete_character(character_id: UUID, request: Request, db: DBSession):
     """Delete a character."""
-    result = await db.execute(select(Character).where(Character.id == character_id))
-    character = result.scalar_one_or_none()
+    # Single DELETE..RETURNING round-trip instead of SELECT-then-DELETE
+    result = await db.execute(
+        delete(Character).where(Character.id == character_id).returning(Character.id)
+    )
 
-    if not character:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Character not found")
 
-    await db.delete(character)
+    await invalidate_character_count(request)
     return None
@@ -1,7 +1,8 @@
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
 
 from src.core.dependencies import DBSession
 from src.models.character import Character
@@ -22,8 +23,7 @@ router = APIRouter()
 
 async def get_ready_character(db: DBSession, character_id: UUID) -> Character:
     """Get a character that is ready for generation."""
-    result = await db.execute(select(Character).where(Character.id == character_id))
-    character = result.scalar_one_or_none()
+    character = await db.get(Character, character_id)
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -46,6 +46,7 @@ async def get_ready_character(db: DBSession, character_id: UUID) -> Character:
 @router.post("/generate-image", response_model=ImageGenerationResponse, status_code=202)
 async def generate_image(
     request: ImageGenerationRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks,
     db: DBSession,
 ):
@@ -54,54 +55,77 @@ async def generate_image(
 
     The image is generated asynchronously. Poll the returned ID for status updates.
     """
-    character = await get_ready_character(db, request.character_id)
-
-    # Create generation record
-    generation = ImageGeneration(
-        character_id=character.id,
-        status=GenerationStatus.PENDING.value,
-        prompt=request.prompt,
-        negative_prompt=request.negative_prompt,
-        width=request.width,
-        height=request.height,
-        num_inference_steps=request.num_inference_steps,
-        guidance_scale=request.guidance_scale,
-        lora_strength=request.lora_strength,
-        seed=request.seed,
+    character = await get_ready_character(db, UUID(request.character_id))
+
+    # Create generation record in one INSERT..RETURNING round-trip
+    stmt = (
+        insert(ImageGeneration)
+        .values(
+            character_id=character.id,
+            status=GenerationStatus.PENDING.value,
+            prompt=request.prompt,
+            negative_prompt=request.negative_prompt,
+            width=request.width,
+            height=request.height,
+            num_inference_steps=request.num_inference_steps,
+            guidance_scale=request.guidance_scale,
+            lora_strength=request.lora_strength,
+            seed=request.seed,
+        )
+        .returning(ImageGeneration)
     )
-
-    db.add(generation)
+    generation = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(generation)
-
-    # Start generation in background
-    background_tasks.add_task(
-        generate_image_task,
-        generation_id=generation.id,
-        character=character,
-        request=request,
-    )
+
+    # Queue generation on the worker; fall back to an in-process task
+    # when the queue is unavailable (dev without Redis)
+    arq = getattr(http_request.app.state, "arq", None)
+    if arq is not None:
+        await arq.enqueue_job(
+            "generate_image",
+            generation_id=str(generation.id),
+            character_id=str(character.id),
+            request=request.model_dump(mode="json"),
+        )
+    else:
+        background_tasks.add_task(
+            generate_image_task,
+            generation_id=generation.id,
+            character=character,
+            request=request,
+        )
 
     return generation
 
 
-@router.get("/generate-image/{generation_id}", response_model=ImageGenerationResponse)
+@router.get(
+    "/generate-image/{generation_id}",
+    response_model=None,
+    responses={200: {"model": ImageGenerationResponse}},
+)
 async def get_image_generation_status(generation_id: UUID, db: DBSession):
     """Get the status of an image generation."""
-    result = await db.execute(
-        select(ImageGeneration).where(ImageGeneration.id == generation_id)
-    )
-    generation = result.scalar_one_or_none()
+    generation = await db.get(ImageGeneration, generation_id)
 
     if not generation:
         raise HTTPException(status_code=404, detail="Generation not found")
 
-    return generation
+    # Status polling is the hottest read path - serialize the row straight
+    # through orjson (UUID/datetime are native) instead of Pydantic
+    return ORJSONResponse({
+        "id": generation.id,
+        "character_id": generation.character_id,
+        "status": generation.status,
+        "image_url": generation.image_url,
+        "prompt": generation.prompt,
+        "created_at": generation.created_at,
+    })
 
 
 @router.post("/generate-video", response_model=VideoGenerationResponse, status_code=202)
 async def generate_video(
     request: VideoGenerationRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks,
     db: DBSession,
 ):
@@ -111,46 +135,67 @@ async def generate_video(
     The video is generated asynchronously. Poll the returned ID for status updates.
     If no source_image_url is provided, an image will be generated first.
     """
-    character = await get_ready_character(db, request.character_id)
-
-    # Create generation record
-    generation = VideoGeneration(
-        character_id=character.id,
-        status=GenerationStatus.PENDING.value,
-        prompt=request.prompt,
-        source_image_url=request.source_image_url,
-        width=request.width,
-        height=request.height,
-        num_frames=request.num_frames,
-        fps=request.fps,
-        motion_bucket_id=request.motion_bucket_id,
-        seed=request.seed,
+    character = await get_ready_character(db, UUID(request.character_id))
+
+    # Create generation record in one INSERT..RETURNING round-trip
+    stmt = (
+        insert(VideoGeneration)
+        .values(
+            character_id=character.id,
+            status=GenerationStatus.PENDING.value,
+            prompt=request.prompt,
+            source_image_url=request.source_image_url,
+            width=request.width,
+            height=request.height,
+            num_frames=request.num_frames,
+            fps=request.fps,
+            motion_bucket_id=request.motion_bucket_id,
+            seed=request.seed,
+        )
+        .returning(VideoGeneration)
     )
-
-    db.add(generation)
+    generation = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(generation)
-
-    # Start generation in background
-    background_tasks.add_task(
-        generate_video_task,
-        generation_id=generation.id,
-        character=character,
-        request=request,
-    )
+
+    # Queue generation on the worker; fall back to an in-process task
+    # when the queue is unavailable (dev without Redis)
+    arq = getattr(http_request.app.state, "arq", None)
+    if arq is not None:
+        await arq.enqueue_job(
+            "generate_video",
+            generation_id=str(generation.id),
+            character_id=str(character.id),
+            request=request.model_dump(mode="json"),
+        )
+    else:
+        background_tasks.add_task(
+            generate_video_task,
+            generation_id=generation.id,
+            character=character,
+            request=request,
+        )
 
     return generation
 
 
-@router.get("/generate-video/{generation_id}", response_model=VideoGenerationResponse)
+@router.get(
+    "/generate-video/{generation_id}",
+    response_model=None,
+    responses={200: {"model": VideoGenerationResponse}},
+)
 async def get_video_generation_status(generation_id: UUID, db: DBSession):
     """Get the status of a video generation."""
-    result = await db.execute(
-        select(VideoGeneration).where(VideoGeneration.id == generation_id)
-    )
-    generation = result.scalar_one_or_none()
+    generation = await db.get(VideoGeneration, generation_id)
 
     if not generation:
         raise HTTPException(status_code=404, detail="Generation not found")
 
-    return generation
+    return ORJSONResponse({
+        "id": generation.id,
+        "character_id": generation.character_id,
+        "status": generation.status,
+        "video_url": generation.video_url,
+        "thumbnail_url": generation.thumbnail_url,
+        "prompt": generation.prompt,
+        "created_at": generation.created_at,
+    })
@@ -1,13 +1,19 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Pre-serialized bodies: liveness probes hit these endpoints constantly,
+# so skip per-request dict construction and JSON encoding
+_HEALTHY = orjson.dumps({"status": "healthy"})
+_ROOT = orjson.dumps({"message": "Character Generation API", "version": "0.1.0"})
+
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "healthy"}
+async def health_check() -> Response:
+    return Response(content=_HEALTHY, media_type="application/json")
 
 
 @router.get("/")
-async def root() -> dict[str, str]:
-    return {"message": "Character Generation API", "version": "0.1.0"}
+async def root() -> Response:
+    return Response(content=_ROOT, media_type="application/json")
@@ -10,12 +10,18 @@ class Settings(BaseSettings):
     # API
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    api_workers: int = 1
     debug: bool = False
     api_key: str = ""  # Required for production
     allowed_origins: str = ""  # Comma-separated list of allowed origins
 
     # Database
     database_url: str
+    database_pool_size: int = 20
+    database_pool_overflow: int = 30
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 1800
+    database_pool_use_lifo: bool = True
 
     # RunPod
     runpod_api_key: str = ""
@@ -10,7 +10,14 @@ settings = get_settings()
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_pool_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
     pool_pre_ping=True,
+    # LIFO keeps a small hot set of connections warm and lets idle overflow
+    # connections age out instead of being cycled round-robin.
+    pool_use_lifo=settings.database_pool_use_lifo,
 )
 
 async_session_maker = async_sessionmaker(
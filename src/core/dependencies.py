@@ -1,8 +1,34 @@
+from functools import lru_cache
 from typing import Annotated
 
+import httpx
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 
+try:
+    # Optional: aiohttp-backed transport avoids the anyio pool-lock
+    # contention in httpcore under heavy concurrent polling.
+    from httpx_aiohttp import AiohttpTransport
+except ImportError:
+    AiohttpTransport = None
+
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared async HTTP client for internal ComfyUI/RunPod traffic.
+
+    Returns a single long-lived client so hot paths reuse connections
+    instead of paying a handshake per call. Uses the aiohttp transport
+    when httpx-aiohttp is installed, plain httpx otherwise.
+    """
+    transport = AiohttpTransport() if AiohttpTransport is not None else None
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(connect=10.0, read=30.0, write=30.0, pool=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
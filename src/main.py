@@ -1,12 +1,22 @@
+import asyncio
+import hmac
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 
+import redis.asyncio as aioredis
+from arq import create_pool
+from arq.connections import RedisSettings
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
 
 from src.api.routes import characters, generation, health
 from src.core.config import get_settings
+from src.core.dependencies import get_http_client
+from src.services.comfyui.client import comfyui_client
+from src.services.runpod.pod_manager import runpod_manager
+from src.services.storage.manager import storage_manager
 
 settings = get_settings()
 
@@ -15,20 +25,52 @@ api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
 async def verify_api_key(api_key: str | None = Depends(api_key_header)) -> str:
-    """Verify API key for protected endpoints."""
-    if not settings.api_key:
-        # No API key configured - allow access (dev mode)
-        return ""
-    if not api_key or api_key != settings.api_key:
+    """Verify API key for protected endpoints (constant-time compare)."""
+    # Compare bytes: compare_digest raises TypeError on non-ASCII str, and
+    # any client can put non-ASCII in a header
+    if not api_key or not hmac.compare_digest(
+        api_key.encode(), settings.api_key.encode()
+    ):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
     return api_key
 
 
+# Only attach the dependency when a key is configured, so dev mode does
+# not pay a coroutine dispatch per request
+protected_deps = [Depends(verify_api_key)] if settings.api_key else []
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
+    # Eager tasks (3.12+) run a coroutine synchronously until its first
+    # real await, skipping Task allocation for ones that finish immediately
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Keep pod health fresh off the request path
+    runpod_manager.start_refresh_loop()
+
+    # Pay the provider's import cost (boto3 model scan) here, not on the
+    # first upload
+    await storage_manager.warmup()
+
+    app.state.redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        app.state.arq = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+    except Exception:
+        # Queue unavailable (dev without Redis) - routes fall back to
+        # in-process BackgroundTasks
+        app.state.arq = None
     yield
     # Shutdown
+    await comfyui_client.aclose()
+    await runpod_manager.aclose()
+    await storage_manager.aclose()
+    await get_http_client().aclose()
+    if app.state.arq is not None:
+        await app.state.arq.aclose()
+    await app.state.redis.aclose()
 
 
 app = FastAPI(
@@ -36,12 +78,14 @@ app = FastAPI(
     description="API for AI character image and video generation with LoRA-based character system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration - use allowed_origins from settings
-allowed_origins = (
-    settings.allowed_origins.split(",") if settings.allowed_origins else ["*"]
-)
+# CORS configuration - frozen at import time; strip whitespace and drop
+# empty entries so a stray comma never allows an empty origin
+allowed_origins = tuple(
+    origin.strip() for origin in settings.allowed_origins.split(",") if origin.strip()
+) or ("*",)
 
 app.add_middleware(
     CORSMiddleware,
@@ -57,10 +101,10 @@ app.include_router(
     characters.router,
     prefix="/characters",
     tags=["Characters"],
-    dependencies=[Depends(verify_api_key)],
+    dependencies=protected_deps,
 )
 app.include_router(
     generation.router,
     tags=["Generation"],
-    dependencies=[Depends(verify_api_key)],
+    dependencies=protected_deps,
 )
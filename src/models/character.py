@@ -1,9 +1,11 @@
+import os.path
 import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid_utils.compat import uuid7
 
 from src.core.database import Base
 
@@ -12,7 +14,7 @@ class Character(Base):
     __tablename__ = "characters"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -28,3 +30,10 @@ class Character(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+    @property
+    def lora_filename(self) -> str | None:
+        """Basename of lora_path, without building a Path per generation."""
+        if self.lora_path is None:
+            return None
+        return os.path.basename(self.lora_path)
@@ -1,21 +1,34 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from src.core.database import Base
 
 
 class ImageGeneration(Base):
     __tablename__ = "image_generations"
+    __table_args__ = (
+        Index(
+            "ix_image_generations_character_created",
+            "character_id",
+            text("created_at DESC"),
+        ),
+        Index(
+            "ix_image_generations_character_cache_key",
+            "character_id",
+            "cache_key",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     character_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("characters.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("characters.id"), nullable=False
     )
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     prompt: Mapped[str] = mapped_column(Text, nullable=False)
@@ -26,6 +39,9 @@ class ImageGeneration(Base):
     guidance_scale: Mapped[float] = mapped_column(Float, nullable=False, default=7.5)
     lora_strength: Mapped[float] = mapped_column(Float, nullable=False, default=0.8)
     seed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Content hash of the generation inputs; set only for seeded requests,
+    # whose outputs are deterministic and therefore reusable
+    cache_key: Mapped[str | None] = mapped_column(String(32), nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -37,12 +53,19 @@ class ImageGeneration(Base):
 
 class VideoGeneration(Base):
     __tablename__ = "video_generations"
+    __table_args__ = (
+        Index(
+            "ix_video_generations_character_created",
+            "character_id",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     character_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("characters.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("characters.id"), nullable=False
     )
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     prompt: Mapped[str] = mapped_column(Text, nullable=False)
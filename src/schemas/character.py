@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class CharacterStatus(str, Enum):
@@ -39,3 +39,10 @@ class CharacterResponse(BaseModel):
 class CharacterListResponse(BaseModel):
     characters: list[CharacterResponse]
     total: int
+    next_cursor: datetime | None = None
+    next_cursor_id: UUID | None = None
+
+
+# Built once at import: validates/dumps a whole page of ORM rows in
+# pydantic-core without per-object model construction
+character_list_adapter = TypeAdapter(list[CharacterResponse])
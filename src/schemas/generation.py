@@ -1,8 +1,21 @@
 from datetime import datetime
 from enum import Enum
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field, StringConstraints
+
+# UUID-shaped string for the hot request path: a regex check is cheaper than
+# pydantic-core's UUID validator, which constructs a uuid.UUID object that we
+# would immediately stringify again. Conversion to UUID happens only at the
+# DB boundary. BeforeValidator(str) keeps UUID objects accepted in code.
+CharacterID = Annotated[
+    str,
+    BeforeValidator(str),
+    StringConstraints(
+        pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+    ),
+]
 
 
 class GenerationStatus(str, Enum):
@@ -13,7 +26,7 @@ class GenerationStatus(str, Enum):
 
 
 class ImageGenerationRequest(BaseModel):
-    character_id: UUID = Field(..., description="Character ID to use for generation")
+    character_id: CharacterID = Field(..., description="Character ID to use for generation")
     prompt: str = Field(..., min_length=1, max_length=1000, description="Generation prompt")
     negative_prompt: str = Field(
         default="blurry, low quality, distorted, deformed",
@@ -40,7 +53,7 @@ class ImageGenerationResponse(BaseModel):
 
 
 class VideoGenerationRequest(BaseModel):
-    character_id: UUID = Field(..., description="Character ID to use for generation")
+    character_id: CharacterID = Field(..., description="Character ID to use for generation")
     prompt: str = Field(..., min_length=1, max_length=1000, description="Generation prompt")
     source_image_url: str | None = Field(
         default=None,
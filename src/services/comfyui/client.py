@@ -1,9 +1,10 @@
 import asyncio
-import json
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 import websockets
 
 from src.core.config import get_settings
@@ -19,6 +20,23 @@ class ComfyUIClient:
         self.client_id = str(uuid.uuid4())
         self._http_url: str | None = None
         self._ws_url: str | None = None
+        self._http: httpx.AsyncClient | None = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Lazily create the long-lived HTTP client."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(60.0),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the HTTP client; called from FastAPI shutdown."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _get_http_url(self) -> str:
         """Get HTTP URL, using RunPod if configured."""
@@ -41,43 +59,46 @@ class ComfyUIClient:
         """Check if ComfyUI is reachable and healthy."""
         try:
             http_url = await self._get_http_url()
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{http_url}/system_stats",
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            response = await self._get_http().get(
+                f"{http_url}/system_stats",
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
     async def queue_prompt(self, workflow: dict[str, Any]) -> str:
         """Queue a workflow and return the prompt_id."""
         http_url = await self._get_http_url()
-        payload = {
+        # Serialize with orjson up front; json= would route the large
+        # workflow dict through httpx's stdlib json encoder
+        body = orjson.dumps({
             "prompt": workflow,
             "client_id": self.client_id,
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{http_url}/prompt",
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["prompt_id"]
+        })
+
+        response = await self._get_http().post(
+            f"{http_url}/prompt",
+            content=body,
+            headers={"Content-Type": "application/json"},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data["prompt_id"]
 
     async def get_history(self, prompt_id: str) -> dict[str, Any]:
         """Get the history/output for a prompt."""
         http_url = await self._get_http_url()
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{http_url}/history/{prompt_id}",
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        # History payloads are large on multi-output workflows; httpx
+        # advertises the codecs it can actually decode (gzip/deflate), and
+        # orjson decodes the body rather than httpx's stdlib path
+        response = await self._get_http().get(
+            f"{http_url}/history/{prompt_id}",
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_image(
         self, filename: str, subfolder: str = "", folder_type: str = "output"
@@ -90,27 +111,66 @@ class ComfyUIClient:
             "type": folder_type,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{http_url}/view",
-                params=params,
-                timeout=60.0,
-            )
+        response = await self._get_http().get(
+            f"{http_url}/view",
+            params=params,
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return response.content
+
+    async def stream_image(
+        self, filename: str, subfolder: str = "", folder_type: str = "output"
+    ) -> AsyncIterator[bytes]:
+        """Stream an image from ComfyUI in chunks without buffering it."""
+        http_url = await self._get_http_url()
+        params = {
+            "filename": filename,
+            "subfolder": subfolder,
+            "type": folder_type,
+        }
+
+        async with self._get_http().stream(
+            "GET",
+            f"{http_url}/view",
+            params=params,
+            timeout=60.0,
+        ) as response:
             response.raise_for_status()
-            return response.content
+            async for chunk in response.aiter_bytes():
+                yield chunk
 
     async def upload_image(self, image_data: bytes, filename: str) -> dict[str, Any]:
         """Upload an image to ComfyUI input folder."""
         http_url = await self._get_http_url()
-        async with httpx.AsyncClient() as client:
-            files = {"image": (filename, image_data, "image/png")}
-            response = await client.post(
-                f"{http_url}/upload/image",
-                files=files,
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        files = {"image": (filename, image_data, "image/png")}
+        response = await self._get_http().post(
+            f"{http_url}/upload/image",
+            files=files,
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _wait_for_completion(self, ws: Any, prompt_id: str) -> None:
+        """Consume WebSocket messages until the prompt completes or errors."""
+        async for message in ws:
+            # orjson takes str or bytes frames directly
+            data = orjson.loads(message)
+
+            if data.get("type") == "executing":
+                exec_data = data.get("data", {})
+                if exec_data.get("prompt_id") == prompt_id:
+                    if exec_data.get("node") is None:
+                        # Execution complete
+                        return
+
+            elif data.get("type") == "execution_error":
+                error_data = data.get("data", {})
+                if error_data.get("prompt_id") == prompt_id:
+                    raise RuntimeError(
+                        f"Workflow execution failed: {error_data.get('exception_message', 'Unknown error')}"
+                    )
 
     async def execute_workflow(
         self,
@@ -125,33 +185,19 @@ class ComfyUIClient:
         ws_url = await self._get_ws_url()
         prompt_id = await self.queue_prompt(workflow)
 
-        async with websockets.connect(f"{ws_url}?clientId={self.client_id}") as ws:
-            start_time = asyncio.get_event_loop().time()
-
-            while True:
-                if asyncio.get_event_loop().time() - start_time > timeout:
-                    raise TimeoutError(f"Workflow execution timed out after {timeout}s")
-
-                try:
-                    message = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                    data = json.loads(message)
-
-                    if data.get("type") == "executing":
-                        exec_data = data.get("data", {})
-                        if exec_data.get("prompt_id") == prompt_id:
-                            if exec_data.get("node") is None:
-                                # Execution complete
-                                break
-
-                    elif data.get("type") == "execution_error":
-                        error_data = data.get("data", {})
-                        if error_data.get("prompt_id") == prompt_id:
-                            raise RuntimeError(
-                                f"Workflow execution failed: {error_data.get('exception_message', 'Unknown error')}"
-                            )
-
-                except asyncio.TimeoutError:
-                    continue
+        async with websockets.connect(
+            f"{ws_url}?clientId={self.client_id}", max_size=2**22
+        ) as ws:
+            # One timeout over the whole wait instead of a 5s wait_for per
+            # recv, which allocated a Task and a timer on every iteration
+            try:
+                await asyncio.wait_for(
+                    self._wait_for_completion(ws, prompt_id), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Workflow execution timed out after {timeout}s"
+                ) from None
 
         # Get the output
         history = await self.get_history(prompt_id)
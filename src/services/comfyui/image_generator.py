@@ -1,8 +1,13 @@
-import json
-import random
+import asyncio
+import hashlib
 from pathlib import Path
+from secrets import randbits
 from uuid import UUID
 
+import orjson
+import redis.asyncio as aioredis
+from sqlalchemy import select, update
+
 from src.core.config import get_settings
 from src.core.database import async_session_maker
 from src.models.character import Character
@@ -13,13 +18,62 @@ from src.services.storage.manager import storage_manager
 
 settings = get_settings()
 
+# In-flight dedup markers: first task to claim a cache key runs the GPU
+# workflow, concurrent identical requests wait on its row instead
+INFLIGHT_KEY_PREFIX = "generate:inflight:"
+INFLIGHT_TTL = 600
+
+_redis: aioredis.Redis | None = None
+
+
+def _get_redis() -> aioredis.Redis:
+    """Lazily create the shared Redis client for dedup markers."""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
 WORKFLOW_PATH = Path(__file__).parent.parent.parent.parent / "workflows" / "sdxl_lora_image.json"
 
+# Template bytes are read once at import; each request parses a fresh dict
+# from them, which is cheaper than re-reading the file and safe to mutate
+with open(WORKFLOW_PATH, "rb") as _f:
+    _WORKFLOW_BYTES = _f.read()
+
 
 def load_image_workflow() -> dict:
-    """Load the SDXL LoRA image generation workflow template."""
-    with open(WORKFLOW_PATH) as f:
-        return json.load(f)
+    """Return a fresh copy of the SDXL LoRA image workflow template."""
+    return orjson.loads(_WORKFLOW_BYTES)
+
+
+# Parameter patches precompiled against the template: (node_id, input_key,
+# getter). Node IDs match the workflow export ("3" KSampler, "5" Empty
+# Latent Image, "6"/"7" CLIP Text Encode, "10" LoRA Loader) and are
+# validated at import so a template edit fails loudly instead of being
+# silently skipped per request.
+_PATCHES = [
+    ("3", "seed", lambda r, c: r.seed if r.seed is not None else randbits(32)),
+    ("3", "steps", lambda r, c: r.num_inference_steps),
+    ("3", "cfg", lambda r, c: r.guidance_scale),
+    ("5", "width", lambda r, c: r.width),
+    ("5", "height", lambda r, c: r.height),
+    # Include trigger word in the positive prompt
+    ("6", "text", lambda r, c: f"{c.trigger_word}, {r.prompt}"),
+    ("7", "text", lambda r, c: r.negative_prompt),
+    ("10", "lora_name", lambda r, c: c.lora_filename),
+    ("10", "strength_model", lambda r, c: r.lora_strength),
+    ("10", "strength_clip", lambda r, c: r.lora_strength),
+]
+
+_template = orjson.loads(_WORKFLOW_BYTES)
+for _node_id, _input_key, _ in _PATCHES:
+    if _input_key not in _template.get(_node_id, {}).get("inputs", {}):
+        raise RuntimeError(
+            f"Workflow template {WORKFLOW_PATH.name} is missing "
+            f"input '{_input_key}' on node '{_node_id}'"
+        )
+del _template
 
 
 def build_image_workflow(
@@ -29,44 +83,76 @@ def build_image_workflow(
     """
     Build the workflow with character LoRA and generation parameters.
 
-    The workflow template uses placeholder values that we replace here.
+    Applies the precompiled parameter patches to a fresh template copy.
     This is the key to the "single workflow serves all characters" pattern.
     """
     workflow = load_image_workflow()
+    for node_id, input_key, getter in _PATCHES:
+        workflow[node_id]["inputs"][input_key] = getter(request, character)
+    return workflow
 
-    seed = request.seed if request.seed is not None else random.randint(0, 2**32 - 1)
 
-    # These node IDs match the workflow template structure
-    # Adjust based on your actual ComfyUI workflow export
+def _first_output(outputs: dict, key: str) -> tuple[str, str] | None:
+    """Return (filename, subfolder) of the first output under ``key``, if any."""
+    return next(
+        (
+            (item["filename"], item.get("subfolder", ""))
+            for node_output in outputs.values()
+            for item in node_output.get(key, [])
+            if item.get("filename")
+        ),
+        None,
+    )
 
-    # KSampler node
-    if "3" in workflow:
-        workflow["3"]["inputs"]["seed"] = seed
-        workflow["3"]["inputs"]["steps"] = request.num_inference_steps
-        workflow["3"]["inputs"]["cfg"] = request.guidance_scale
 
-    # Empty Latent Image node
-    if "5" in workflow:
-        workflow["5"]["inputs"]["width"] = request.width
-        workflow["5"]["inputs"]["height"] = request.height
+def compute_cache_key(character: Character, request: ImageGenerationRequest) -> str | None:
+    """
+    Content hash of everything that determines the output image.
 
-    # CLIP Text Encode (positive prompt)
-    if "6" in workflow:
-        # Include trigger word in prompt
-        full_prompt = f"{character.trigger_word}, {request.prompt}"
-        workflow["6"]["inputs"]["text"] = full_prompt
+    Returns None for unseeded requests: a random seed makes every run
+    unique, so there is nothing to deduplicate.
+    """
+    if request.seed is None:
+        return None
+    payload = request.model_dump() | {
+        "char": str(character.id),
+        "lora": character.lora_path,
+        "trigger": character.trigger_word,
+    }
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
 
-    # CLIP Text Encode (negative prompt)
-    if "7" in workflow:
-        workflow["7"]["inputs"]["text"] = request.negative_prompt
 
-    # LoRA Loader node
-    if "10" in workflow:
-        workflow["10"]["inputs"]["lora_name"] = Path(character.lora_path).name
-        workflow["10"]["inputs"]["strength_model"] = request.lora_strength
-        workflow["10"]["inputs"]["strength_clip"] = request.lora_strength
+async def _cached_image_url(character_id: UUID, cache_key: str) -> str | None:
+    """Look up the image_url of a completed generation with the same inputs."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(ImageGeneration.image_url)
+            .where(
+                ImageGeneration.character_id == character_id,
+                ImageGeneration.cache_key == cache_key,
+                ImageGeneration.status == GenerationStatus.COMPLETED.value,
+                ImageGeneration.image_url.is_not(None),
+            )
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
 
-    return workflow
+
+async def _await_inflight(owner_id: str, timeout: float = 300.0) -> str | None:
+    """Poll the claiming generation's row until it completes, fails, or times out."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        await asyncio.sleep(2.0)
+        async with async_session_maker() as session:
+            owner = await session.get(ImageGeneration, UUID(owner_id))
+        if owner is None or owner.status == GenerationStatus.FAILED.value:
+            return None
+        if owner.status == GenerationStatus.COMPLETED.value and owner.image_url:
+            return owner.image_url
+    return None
 
 
 async def update_generation_status(
@@ -74,21 +160,24 @@ async def update_generation_status(
     status: GenerationStatus,
     image_url: str | None = None,
     error: str | None = None,
+    cache_key: str | None = None,
 ) -> None:
-    """Update generation status in database."""
+    """Update generation status in database with a single UPDATE."""
+    values: dict = {"status": status.value}
+    if image_url:
+        values["image_url"] = image_url
+    if error:
+        values["error"] = error
+    if cache_key:
+        values["cache_key"] = cache_key
+
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(ImageGeneration).where(ImageGeneration.id == generation_id)
+        await session.execute(
+            update(ImageGeneration)
+            .where(ImageGeneration.id == generation_id)
+            .values(**values)
         )
-        generation = result.scalar_one_or_none()
-        if generation:
-            generation.status = status.value
-            if image_url:
-                generation.image_url = image_url
-            if error:
-                generation.error = error
-            await session.commit()
+        await session.commit()
 
 
 async def generate_image_task(
@@ -99,38 +188,76 @@ async def generate_image_task(
     """
     Background task to generate an image.
 
-    1. Build workflow with character LoRA
-    2. Execute via ComfyUI
-    3. Upload result to cloud storage
-    4. Update database with result URL
+    1. Reuse a cached result for identical seeded inputs, if one exists
+    2. Build workflow with character LoRA
+    3. Execute via ComfyUI
+    4. Upload result to cloud storage
+    5. Update database with result URL
     """
+    cache_key = compute_cache_key(character, request)
+    inflight_key = None
     try:
-        await update_generation_status(generation_id, GenerationStatus.PROCESSING)
+        if cache_key:
+            # Identical seeded inputs produce identical outputs - reuse a
+            # completed result instead of re-running the GPU workflow
+            cached_url = await _cached_image_url(character.id, cache_key)
+            if cached_url:
+                await update_generation_status(
+                    generation_id,
+                    GenerationStatus.COMPLETED,
+                    image_url=cached_url,
+                    cache_key=cache_key,
+                )
+                return
 
-        # Build and execute workflow
+            # Claim the in-flight marker; if another task holds it, wait on
+            # that task's row instead of starting a second run. Redis being
+            # unavailable just means no dedup.
+            try:
+                redis = _get_redis()
+                key = INFLIGHT_KEY_PREFIX + cache_key
+                if await redis.set(key, str(generation_id), nx=True, ex=INFLIGHT_TTL):
+                    inflight_key = key
+                else:
+                    owner_id = await redis.get(key)
+                    if owner_id and owner_id != str(generation_id):
+                        cached_url = await _await_inflight(owner_id)
+                        if cached_url:
+                            await update_generation_status(
+                                generation_id,
+                                GenerationStatus.COMPLETED,
+                                image_url=cached_url,
+                                cache_key=cache_key,
+                            )
+                            return
+            except Exception:
+                pass
+
+        # Build and execute workflow; the PROCESSING status write is
+        # independent I/O, so overlap it with queueing the workflow. The
+        # finally block settles the write before any FAILED transition, so
+        # a fast workflow failure cannot be overwritten by a late
+        # PROCESSING commit.
         workflow = build_image_workflow(character, request)
-        outputs = await comfyui_client.execute_workflow(workflow)
+        mark_processing = asyncio.create_task(
+            update_generation_status(
+                generation_id, GenerationStatus.PROCESSING, cache_key=cache_key
+            )
+        )
+        try:
+            outputs = await comfyui_client.execute_workflow(workflow)
+        finally:
+            await mark_processing
 
         # Find the output image
-        image_data = None
-        for node_id, node_output in outputs.items():
-            if "images" in node_output:
-                for img in node_output["images"]:
-                    filename = img.get("filename")
-                    subfolder = img.get("subfolder", "")
-                    if filename:
-                        image_data = await comfyui_client.get_image(filename, subfolder)
-                        break
-                if image_data:
-                    break
-
-        if not image_data:
+        image_ref = _first_output(outputs, "images")
+        if not image_ref:
             raise RuntimeError("No output image found in workflow results")
 
-        # Upload to cloud storage
+        # Stream ComfyUI -> cloud storage without buffering the whole image
         storage_path = f"characters/{character.id}/images/{generation_id}.png"
         image_url = await storage_manager.upload(
-            data=image_data,
+            data=comfyui_client.stream_image(*image_ref),
             path=storage_path,
             content_type="image/png",
         )
@@ -148,3 +275,10 @@ async def generate_image_task(
             error=str(e),
         )
         raise
+
+    finally:
+        if inflight_key:
+            try:
+                await _get_redis().delete(inflight_key)
+            except Exception:
+                pass
@@ -1,26 +1,35 @@
-import json
-import random
+import asyncio
 from pathlib import Path
+from secrets import randbits
 from uuid import UUID
 
+import orjson
+from sqlalchemy import update
+
 from src.core.config import get_settings
 from src.core.database import async_session_maker
 from src.models.character import Character
 from src.models.generation import VideoGeneration
 from src.schemas.generation import GenerationStatus, VideoGenerationRequest
 from src.services.comfyui.client import comfyui_client
-from src.services.comfyui.image_generator import build_image_workflow, ImageGenerationRequest
+from src.services.comfyui.image_generator import (
+    ImageGenerationRequest,
+    _first_output,
+    build_image_workflow,
+)
 from src.services.storage.manager import storage_manager
 
 settings = get_settings()
 
 WORKFLOW_PATH = Path(__file__).parent.parent.parent.parent / "workflows" / "svd_video.json"
 
+with open(WORKFLOW_PATH, "rb") as _f:
+    _WORKFLOW_BYTES = _f.read()
+
 
 def load_video_workflow() -> dict:
-    """Load the SVD video generation workflow template."""
-    with open(WORKFLOW_PATH) as f:
-        return json.load(f)
+    """Return a fresh copy of the SVD video workflow template."""
+    return orjson.loads(_WORKFLOW_BYTES)
 
 
 def build_video_workflow(
@@ -34,7 +43,7 @@ def build_video_workflow(
     """
     workflow = load_video_workflow()
 
-    seed = request.seed if request.seed is not None else random.randint(0, 2**32 - 1)
+    seed = request.seed if request.seed is not None else randbits(32)
 
     # Load Image node - source image for video
     if "1" in workflow:
@@ -62,22 +71,22 @@ async def update_generation_status(
     thumbnail_url: str | None = None,
     error: str | None = None,
 ) -> None:
-    """Update generation status in database."""
+    """Update generation status in database with a single UPDATE."""
+    values: dict = {"status": status.value}
+    if video_url:
+        values["video_url"] = video_url
+    if thumbnail_url:
+        values["thumbnail_url"] = thumbnail_url
+    if error:
+        values["error"] = error
+
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(VideoGeneration).where(VideoGeneration.id == generation_id)
+        await session.execute(
+            update(VideoGeneration)
+            .where(VideoGeneration.id == generation_id)
+            .values(**values)
         )
-        generation = result.scalar_one_or_none()
-        if generation:
-            generation.status = status.value
-            if video_url:
-                generation.video_url = video_url
-            if thumbnail_url:
-                generation.thumbnail_url = thumbnail_url
-            if error:
-                generation.error = error
-            await session.commit()
+        await session.commit()
 
 
 async def generate_video_task(
@@ -95,73 +104,65 @@ async def generate_video_task(
     5. Update database with result URL
     """
     try:
-        await update_generation_status(generation_id, GenerationStatus.PROCESSING)
-
-        source_image_path = None
-
-        # If no source image provided, generate one first
-        if not request.source_image_url:
-            # Generate a character image first
-            image_request = ImageGenerationRequest(
-                character_id=request.character_id,
-                prompt=request.prompt,
-                width=request.width,
-                height=request.height,
-            )
-            image_workflow = build_image_workflow(character, image_request)
-            image_outputs = await comfyui_client.execute_workflow(image_workflow)
-
-            # Get the generated image
-            for node_id, node_output in image_outputs.items():
-                if "images" in node_output:
-                    for img in node_output["images"]:
-                        filename = img.get("filename")
-                        if filename:
-                            source_image_path = filename
-                            break
-                    if source_image_path:
-                        break
-
-            if not source_image_path:
-                raise RuntimeError("Failed to generate source image for video")
-        else:
-            # Download source image and upload to ComfyUI
-            import httpx
-            async with httpx.AsyncClient() as client:
+        # The PROCESSING status write is independent I/O - run it
+        # concurrently with resolving the source image and executing
+        mark_processing = asyncio.create_task(
+            update_generation_status(generation_id, GenerationStatus.PROCESSING)
+        )
+
+        try:
+            source_image_path = None
+
+            # If no source image provided, generate one first
+            if not request.source_image_url:
+                # Generate a character image first
+                image_request = ImageGenerationRequest(
+                    character_id=request.character_id,
+                    prompt=request.prompt,
+                    width=request.width,
+                    height=request.height,
+                )
+                image_workflow = build_image_workflow(character, image_request)
+                image_outputs = await comfyui_client.execute_workflow(image_workflow)
+
+                # Get the generated image
+                image_ref = _first_output(image_outputs, "images")
+                if image_ref:
+                    source_image_path = image_ref[0]
+
+                if not source_image_path:
+                    raise RuntimeError("Failed to generate source image for video")
+            else:
+                # Download source image and upload to ComfyUI
+                from src.core.dependencies import get_http_client
+
+                client = get_http_client()
                 response = await client.get(request.source_image_url)
                 response.raise_for_status()
                 image_data = response.content
 
-            upload_result = await comfyui_client.upload_image(
-                image_data,
-                f"source_{generation_id}.png"
-            )
-            source_image_path = upload_result.get("name")
+                upload_result = await comfyui_client.upload_image(
+                    image_data,
+                    f"source_{generation_id}.png"
+                )
+                source_image_path = upload_result.get("name")
 
-        # Build and execute video workflow
-        workflow = build_video_workflow(source_image_path, request)
-        outputs = await comfyui_client.execute_workflow(workflow, timeout=600.0)
+            # Build and execute video workflow
+            workflow = build_video_workflow(source_image_path, request)
+            outputs = await comfyui_client.execute_workflow(workflow, timeout=600.0)
+        finally:
+            # Settle the status write before any further status transition
+            await mark_processing
 
         # Find the output video
-        video_data = None
-        for node_id, node_output in outputs.items():
-            if "gifs" in node_output:
-                for vid in node_output["gifs"]:
-                    filename = vid.get("filename")
-                    subfolder = vid.get("subfolder", "")
-                    if filename:
-                        video_data = await comfyui_client.get_image(filename, subfolder)
-                        break
-                if video_data:
-                    break
-
-        if not video_data:
+        video_ref = _first_output(outputs, "gifs")
+        if not video_ref:
             raise RuntimeError("No output video found in workflow results")
 
-        # Upload to cloud storage
+        # Stream ComfyUI -> cloud storage without buffering the whole video
         storage_path = f"characters/{character.id}/videos/{generation_id}.mp4"
         video_url = await storage_manager.upload(
-            data=video_data,
+            data=comfyui_client.stream_image(*video_ref),
             path=storage_path,
             content_type="video/mp4",
         )
@@ -7,10 +7,11 @@ Provides pod selection, health checking, and scaling support.
 
 import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 
 import httpx
+import orjson
 
 from src.core.config import get_settings
 
@@ -54,7 +55,33 @@ class RunPodManager:
         self.endpoint_id = settings.runpod_endpoint_id
         self._pods: dict[str, Pod] = {}
         self._health_check_interval = 30  # seconds
-        self._last_refresh: datetime | None = None
+        self._last_refresh_mono: float = 0.0
+        self._http: httpx.AsyncClient | None = None
+        self._refresh_task: asyncio.Task | None = None
+        # Derived once - the static fallback URL never changes at runtime
+        self._static_ws_url = (
+            settings.comfyui_http_url.replace("http://", "ws://").replace("https://", "wss://")
+            + "/ws"
+        )
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Lazily create the long-lived HTTP client."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(60.0),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Stop the refresh loop and close the HTTP client; called from FastAPI shutdown."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     @property
     def is_configured(self) -> bool:
@@ -72,20 +99,19 @@ class RunPodManager:
         if variables:
             payload["variables"] = variables
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.BASE_URL,
-                headers=headers,
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._get_http().post(
+            self.BASE_URL,
+            headers=headers,
+            content=orjson.dumps(payload),
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            if "errors" in data:
-                raise RuntimeError(f"RunPod API error: {data['errors']}")
+        if "errors" in data:
+            raise RuntimeError(f"RunPod API error: {data['errors']}")
 
-            return data.get("data", {})
+        return data.get("data", {})
 
     async def list_pods(self) -> list[Pod]:
         """List all pods from RunPod account."""
@@ -155,58 +181,111 @@ class RunPodManager:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{pod.comfyui_url}/system_stats",
-                    timeout=10.0,
-                )
-                is_healthy = response.status_code == 200
-                pod.is_healthy = is_healthy
-                pod.last_health_check = datetime.utcnow()
-                return is_healthy
+            response = await self._get_http().get(
+                f"{pod.comfyui_url}/system_stats",
+                timeout=10.0,
+            )
+            is_healthy = response.status_code == 200
+            pod.is_healthy = is_healthy
+            pod.last_health_check = datetime.utcnow()
+            return is_healthy
         except Exception:
             pod.is_healthy = False
             pod.last_health_check = datetime.utcnow()
             return False
 
     async def refresh_pods(self, force: bool = False) -> None:
-        """Refresh pod list and health status."""
-        now = datetime.utcnow()
-
-        # Skip if recently refreshed
-        if not force and self._last_refresh:
-            if now - self._last_refresh < timedelta(seconds=self._health_check_interval):
-                return
+        """Refresh pod list and health status; runs off the request path."""
+        # Monotonic float compare - no datetime/timedelta allocation on the
+        # warm-cache path
+        now = asyncio.get_running_loop().time()
+        if not force and now - self._last_refresh_mono < self._health_check_interval:
+            return
 
         pods = await self.list_pods()
 
         # Check health in parallel
-        health_tasks = [self.check_pod_health(pod) for pod in pods]
-        await asyncio.gather(*health_tasks, return_exceptions=True)
+        if pods:
+            health_tasks = [self.check_pod_health(pod) for pod in pods]
+            await asyncio.gather(*health_tasks, return_exceptions=True)
 
         # Update cache
         self._pods = {pod.id: pod for pod in pods}
-        self._last_refresh = now
+        self._last_refresh_mono = now
 
-    async def get_available_pod(self) -> Pod | None:
-        """
-        Get a healthy, available pod for workload execution.
+    def start_refresh_loop(self) -> asyncio.Task | None:
+        """Schedule the periodic pod refresh; called from FastAPI startup."""
+        if not self.is_configured or self._refresh_task is not None:
+            return self._refresh_task
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        return self._refresh_task
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_pods(force=True)
+            except Exception:
+                # Keep the loop alive through transient RunPod API failures
+                pass
+            await asyncio.sleep(self._health_check_interval)
+
+    async def _check_pod(self, pod: Pod) -> Pod | None:
+        """Health-check a pod, returning it only if healthy."""
+        return pod if await self.check_pod_health(pod) else None
 
-        Uses simple round-robin with health check fallback.
+    async def find_first_healthy_pod(self) -> Pod | None:
         """
-        await self.refresh_pods()
+        Return the first pod that passes a health check.
 
-        # Filter to healthy, running pods
-        healthy_pods = [
-            pod for pod in self._pods.values()
-            if pod.status == PodStatus.RUNNING and pod.is_healthy and pod.comfyui_url
+        Unlike a full refresh, this does not wait for slow or timed-out
+        pods: remaining checks are cancelled once one pod answers.
+        """
+        pods = [
+            pod for pod in await self.list_pods()
+            if pod.status == PodStatus.RUNNING and pod.comfyui_url
         ]
-
-        if not healthy_pods:
+        if not pods:
             return None
 
-        # Simple selection - could be enhanced with load balancing
-        return healthy_pods[0]
+        tasks = [asyncio.ensure_future(self._check_pod(pod)) for pod in pods]
+        found = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    pod = await next_done
+                except Exception:
+                    continue
+                if pod is not None:
+                    found = pod
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        # Keep the cache warm with whatever this pass learned
+        self._pods.update({pod.id: pod for pod in pods})
+        return found
+
+    async def get_available_pod(self) -> Pod | None:
+        """
+        Get a healthy, available pod for workload execution.
+
+        Serves from the cache maintained by the background refresh loop;
+        if the cache is stale or empty, races health checks and takes the
+        first responder instead of waiting on every pod.
+        """
+        now = asyncio.get_running_loop().time()
+        if now - self._last_refresh_mono < self._health_check_interval:
+            healthy_pods = [
+                pod for pod in self._pods.values()
+                if pod.status == PodStatus.RUNNING and pod.is_healthy and pod.comfyui_url
+            ]
+            if healthy_pods:
+                # Simple selection - could be enhanced with load balancing
+                return healthy_pods[0]
+
+        return await self.find_first_healthy_pod()
 
     async def get_comfyui_url(self) -> str:
         """
@@ -227,6 +306,9 @@ class RunPodManager:
 
     async def get_comfyui_ws_url(self) -> str:
         """Get WebSocket URL for ComfyUI."""
+        if not self.is_configured:
+            return self._static_ws_url
+
         http_url = await self.get_comfyui_url()
         # Convert http:// to ws://
         ws_url = http_url.replace("http://", "ws://").replace("https://", "wss://")
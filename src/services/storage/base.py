@@ -1,4 +1,17 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from pathlib import Path
+
+import aiofiles
+
+UPLOAD_FILE_CHUNK_SIZE = 1 << 20
+
+
+async def ensure_bytes(data: AsyncIterable[bytes] | bytes) -> bytes:
+    """Materialize streamed data for providers that need the full payload."""
+    if isinstance(data, bytes):
+        return data
+    return b"".join([chunk async for chunk in data])
 
 
 class BaseStorageProvider(ABC):
@@ -7,7 +20,7 @@ class BaseStorageProvider(ABC):
     @abstractmethod
     async def upload(
         self,
-        data: bytes,
+        data: AsyncIterable[bytes] | bytes,
         path: str,
         content_type: str = "application/octet-stream",
     ) -> str:
@@ -15,7 +28,7 @@ class BaseStorageProvider(ABC):
         Upload data to storage and return the public URL.
 
         Args:
-            data: File content as bytes
+            data: File content as bytes or an async stream of chunks
             path: Storage path (e.g., "characters/123/images/456.png")
             content_type: MIME type of the file
 
@@ -24,6 +37,29 @@ class BaseStorageProvider(ABC):
         """
         pass
 
+    async def upload_file(
+        self,
+        local_path: str | Path,
+        path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Upload a file from disk without loading it fully into memory.
+
+        Providers with a native streaming/multipart API should override this.
+        """
+        async def _chunks() -> AsyncIterable[bytes]:
+            async with aiofiles.open(local_path, "rb") as f:
+                while chunk := await f.read(UPLOAD_FILE_CHUNK_SIZE):
+                    yield chunk
+
+        return await self.upload(_chunks(), path, content_type)
+
+    @abstractmethod
+    async def download(self, path: str) -> bytes:
+        """Download a file from storage and return its content."""
+        pass
+
     @abstractmethod
     async def delete(self, path: str) -> None:
         """Delete a file from storage."""
@@ -1,5 +1,9 @@
+import asyncio
+from collections.abc import AsyncIterable
 from pathlib import Path
 
+import aiofiles
+
 from .base import BaseStorageProvider
 
 
@@ -12,19 +16,29 @@ class LocalStorageProvider(BaseStorageProvider):
 
     async def upload(
         self,
-        data: bytes,
+        data: AsyncIterable[bytes] | bytes,
         path: str,
         content_type: str = "application/octet-stream",
     ) -> str:
         dest_path = self.base_dir / path
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_bytes(data)
+        # Keep multi-MB writes off the event loop thread
+        await asyncio.to_thread(dest_path.parent.mkdir, parents=True, exist_ok=True)
+        async with aiofiles.open(dest_path, "wb") as f:
+            if isinstance(data, bytes):
+                await f.write(data)
+            else:
+                async for chunk in data:
+                    await f.write(chunk)
         return f"file://{dest_path}"
 
+    async def download(self, path: str) -> bytes:
+        async with aiofiles.open(self.base_dir / path, "rb") as f:
+            return await f.read()
+
     async def delete(self, path: str) -> None:
         file_path = self.base_dir / path
-        if file_path.exists():
-            file_path.unlink()
+        if await asyncio.to_thread(file_path.exists):
+            await asyncio.to_thread(file_path.unlink)
 
     async def get_url(self, path: str) -> str:
         return f"file://{self.base_dir / path}"
@@ -1,11 +1,38 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
 from src.core.config import get_settings
 from src.services.storage.base import BaseStorageProvider
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Cap concurrent uploads in a batch so one large batch cannot exhaust the
+# provider's connection pool
+UPLOAD_MANY_CONCURRENCY = 16
+
+
+@dataclass
+class UploadSpec:
+    """One item for StorageManager.upload_many.
+
+    source may be raw bytes, an async byte iterator, or a Path to stream
+    from disk via the provider's upload_file.
+    """
+
+    source: AsyncIterable[bytes] | bytes | Path
+    path: str
+    content_type: str = "application/octet-stream"
 
 
+@lru_cache(maxsize=1)
 def get_storage_provider() -> BaseStorageProvider:
-    """Factory function to get the configured storage provider."""
+    """Get the configured storage provider (constructed exactly once)."""
     if settings.storage_provider == "s3":
         from src.services.storage.s3_provider import S3StorageProvider
         return S3StorageProvider()
@@ -26,23 +53,34 @@ class StorageManager:
     Provides a unified interface to upload/download regardless of provider.
     """
 
-    _provider: BaseStorageProvider | None = None
-
     @property
     def provider(self) -> BaseStorageProvider:
-        if self._provider is None:
-            self._provider = get_storage_provider()
-        return self._provider
+        # lru_cache makes lazy construction idempotent across threads and
+        # tasks - the old unlocked None-check could build two providers
+        return get_storage_provider()
 
     async def upload(
         self,
-        data: bytes,
+        data: AsyncIterable[bytes] | bytes,
         path: str,
         content_type: str = "application/octet-stream",
     ) -> str:
         """Upload data and return the public URL."""
         return await self.provider.upload(data, path, content_type)
 
+    async def upload_file(
+        self,
+        local_path: str | Path,
+        path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Upload a file from disk and return the public URL."""
+        return await self.provider.upload_file(local_path, path, content_type)
+
+    async def download(self, path: str) -> bytes:
+        """Download a file from storage."""
+        return await self.provider.download(path)
+
     async def delete(self, path: str) -> None:
         """Delete a file from storage."""
         await self.provider.delete(path)
@@ -51,6 +89,50 @@ class StorageManager:
         """Get the public URL for a file."""
         return await self.provider.get_url(path)
 
+    async def upload_many(self, items: list[UploadSpec]) -> list[str]:
+        """Upload a batch concurrently; returns URLs in input order."""
+        semaphore = asyncio.Semaphore(UPLOAD_MANY_CONCURRENCY)
+
+        async def _upload_one(spec: UploadSpec) -> tuple[str, float]:
+            async with semaphore:
+                start = time.perf_counter()
+                if isinstance(spec.source, Path):
+                    url = await self.provider.upload_file(
+                        spec.source, spec.path, spec.content_type
+                    )
+                else:
+                    url = await self.provider.upload(
+                        spec.source, spec.path, spec.content_type
+                    )
+                return url, time.perf_counter() - start
+
+        results = await asyncio.gather(*(_upload_one(spec) for spec in items))
+        if results:
+            slowest = max(zip(items, results), key=lambda pair: pair[1][1])
+            logger.debug(
+                "upload_many: slowest item %s took %.2fs",
+                slowest[0].path,
+                slowest[1][1],
+            )
+        return [url for url, _ in results]
+
+    async def warmup(self) -> None:
+        """Construct the provider ahead of the first request.
+
+        The first provider access pays the deferred boto3/supabase import
+        (boto3 alone scans its service models, ~200 ms); doing it at app
+        startup keeps that cost off the first user-facing request.
+        """
+        _ = self.provider
+
+    async def aclose(self) -> None:
+        """Close the provider's connections, if one was ever constructed."""
+        if get_storage_provider.cache_info().currsize:
+            close = getattr(self.provider, "close", None)
+            if close is not None:
+                await close()
+            get_storage_provider.cache_clear()
+
 
 # Global storage manager instance
 storage_manager = StorageManager()
@@ -1,50 +1,72 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from pathlib import Path
 
-import boto3
-from botocore.config import Config
+import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
 
 from src.core.config import get_settings
-from src.services.storage.base import BaseStorageProvider
+from src.services.storage.base import BaseStorageProvider, ensure_bytes
 
 settings = get_settings()
 
-# Thread pool for running sync boto3 calls
-_executor = ThreadPoolExecutor(max_workers=4)
-
 
 class S3StorageProvider(BaseStorageProvider):
-    """AWS S3 storage provider with async support."""
+    """AWS S3 storage provider running natively on the event loop."""
 
     def __init__(self):
         self.bucket = settings.s3_bucket
         self.region = settings.aws_region
+        # Built once; get_url_sync runs per returned asset URL
+        self._url_prefix = f"https://{self.bucket}.s3.{self.region}.amazonaws.com/"
 
-        self.client = boto3.client(
-            "s3",
+        self.session = aioboto3.Session(
             aws_access_key_id=settings.aws_access_key_id,
             aws_secret_access_key=settings.aws_secret_access_key,
             region_name=self.region,
-            config=Config(signature_version="s3v4"),
         )
+        self._client = None
+        self._client_cm = None
+        self._client_lock = asyncio.Lock()
 
-    async def _run_sync(self, func, *args, **kwargs):
-        """Run a synchronous function in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            _executor, partial(func, *args, **kwargs)
-        )
+    async def _get_client(self):
+        """Enter the aioboto3 client context once and reuse it for all calls."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    # One shared client for all data-plane calls; the pool is
+                    # sized well above expected parallelism so concurrent
+                    # uploads overlap on the wire instead of queueing for a
+                    # connection
+                    self._client_cm = self.session.client(
+                        "s3",
+                        config=AioConfig(
+                            signature_version="s3v4",
+                            max_pool_connections=64,
+                            tcp_keepalive=True,
+                            retries={"max_attempts": 5, "mode": "adaptive"},
+                        ),
+                    )
+                    self._client = await self._client_cm.__aenter__()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the S3 client; called from FastAPI shutdown."""
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(None, None, None)
+            self._client = None
+            self._client_cm = None
 
     async def upload(
         self,
-        data: bytes,
+        data,
         path: str,
         content_type: str = "application/octet-stream",
     ) -> str:
         """Upload data to S3 and return the public URL."""
-        await self._run_sync(
-            self.client.put_object,
+        data = await ensure_bytes(data)
+        client = await self._get_client()
+        await client.put_object(
             Bucket=self.bucket,
             Key=path,
             Body=data,
@@ -53,9 +75,60 @@ class S3StorageProvider(BaseStorageProvider):
 
         return self.get_url_sync(path)
 
+    async def upload_file(
+        self,
+        local_path: str | Path,
+        path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Stream a file from disk to S3 with parallel multipart parts."""
+        client = await self._get_client()
+        await client.upload_file(
+            str(local_path),
+            self.bucket,
+            path,
+            ExtraArgs={"ContentType": content_type},
+            Config=TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=8 * 1024 * 1024,
+                max_concurrency=10,
+            ),
+        )
+        return self.get_url_sync(path)
+
+    async def generate_presigned_put(
+        self,
+        path: str,
+        content_type: str = "application/octet-stream",
+        expires: int = 3600,
+    ) -> str:
+        """Presign a PUT URL so another process can upload the object directly."""
+        client = await self._get_client()
+        return await client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": path, "ContentType": content_type},
+            ExpiresIn=expires,
+        )
+
+    async def exists(self, path: str) -> bool:
+        """Check whether an object exists without downloading it."""
+        client = await self._get_client()
+        try:
+            await client.head_object(Bucket=self.bucket, Key=path)
+            return True
+        except Exception:
+            return False
+
+    async def download(self, path: str) -> bytes:
+        """Download an object from S3."""
+        client = await self._get_client()
+        response = await client.get_object(Bucket=self.bucket, Key=path)
+        async with response["Body"] as stream:
+            return await stream.read()
+
     def get_url_sync(self, path: str) -> str:
         """Get the public URL for an S3 object."""
-        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{path}"
+        return self._url_prefix + path
 
     async def get_url(self, path: str) -> str:
         """Get the public URL for an S3 object."""
@@ -63,8 +136,5 @@ class S3StorageProvider(BaseStorageProvider):
 
     async def delete(self, path: str) -> None:
         """Delete an object from S3."""
-        await self._run_sync(
-            self.client.delete_object,
-            Bucket=self.bucket,
-            Key=path,
-        )
+        client = await self._get_client()
+        await client.delete_object(Bucket=self.bucket, Key=path)
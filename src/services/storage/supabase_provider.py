@@ -1,7 +1,9 @@
+import asyncio
+
 from supabase import create_client
 
 from src.core.config import get_settings
-from src.services.storage.base import BaseStorageProvider
+from src.services.storage.base import BaseStorageProvider, ensure_bytes
 
 settings = get_settings()
 
@@ -18,12 +20,16 @@ class SupabaseStorageProvider(BaseStorageProvider):
 
     async def upload(
         self,
-        data: bytes,
+        data,
         path: str,
         content_type: str = "application/octet-stream",
     ) -> str:
         """Upload data to Supabase Storage and return the public URL."""
-        self.client.storage.from_(self.bucket).upload(
+        data = await ensure_bytes(data)
+        # The supabase SDK is synchronous - run its network calls in a
+        # worker thread so multi-MB transfers don't block the event loop
+        await asyncio.to_thread(
+            self.client.storage.from_(self.bucket).upload,
             path,
             data,
             file_options={"content-type": content_type},
@@ -31,6 +37,32 @@ class SupabaseStorageProvider(BaseStorageProvider):
 
         return await self.get_url(path)
 
+    async def upload_file(
+        self,
+        local_path,
+        path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Upload a file from disk; the SDK streams from the open handle."""
+
+        def _upload_from_disk() -> None:
+            with open(local_path, "rb") as f:
+                self.client.storage.from_(self.bucket).upload(
+                    path,
+                    f,
+                    file_options={"content-type": content_type},
+                )
+
+        await asyncio.to_thread(_upload_from_disk)
+
+        return await self.get_url(path)
+
+    async def download(self, path: str) -> bytes:
+        """Download an object from Supabase Storage."""
+        return await asyncio.to_thread(
+            self.client.storage.from_(self.bucket).download, path
+        )
+
     async def get_url(self, path: str) -> str:
         """Get the public URL for a Supabase Storage object."""
         response = self.client.storage.from_(self.bucket).get_public_url(path)
@@ -38,4 +70,6 @@ class SupabaseStorageProvider(BaseStorageProvider):
 
     async def delete(self, path: str) -> None:
         """Delete an object from Supabase Storage."""
-        self.client.storage.from_(self.bucket).remove([path])
+        await asyncio.to_thread(
+            self.client.storage.from_(self.bucket).remove, [path]
+        )
@@ -1,20 +1,23 @@
 import asyncio
-import json
+import importlib.util
 import logging
 import os
+import shlex
 import shutil
 import tempfile
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
 
-import aiofiles
-from fastapi import UploadFile
+import orjson
+from sqlalchemy import select
 
 from src.core.config import get_settings
 from src.core.database import async_session_maker
 from src.models.character import Character
 from src.schemas.character import CharacterStatus
-from src.services.storage.manager import storage_manager
+from src.services.storage.manager import UploadSpec, storage_manager
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -26,6 +29,12 @@ class TrainingDependencyError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def _kohya_available() -> bool:
+    """Probe once whether kohya_ss is importable in this environment."""
+    return importlib.util.find_spec("kohya_ss") is not None
+
+
 async def verify_training_dependencies() -> None:
     """
     Verify that training dependencies are available.
@@ -42,23 +51,13 @@ async def verify_training_dependencies() -> None:
                 f"Training script not found: {training_script}. "
                 "Please set LORA_TRAINING_SCRIPT to a valid path or ensure kohya_ss is installed."
             )
-    else:
-        # Check for kohya_ss installation
-        try:
-            process = await asyncio.create_subprocess_shell(
-                "python -c 'import kohya_ss'",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await process.communicate()
-            if process.returncode != 0:
-                raise TrainingDependencyError(
-                    "kohya_ss not installed. Please install it or set LORA_TRAINING_SCRIPT "
-                    "environment variable to your training script path."
-                )
-        except Exception as e:
-            logger.warning(f"Could not verify kohya_ss installation: {e}")
-            # Don't fail here - will fail at training time with better error
+    elif not _kohya_available():
+        # In-process import probe - the old subprocess check forked a whole
+        # interpreter per call just to try the import
+        raise TrainingDependencyError(
+            "kohya_ss not installed. Please install it or set LORA_TRAINING_SCRIPT "
+            "environment variable to your training script path."
+        )
 
 
 async def update_character_status(
@@ -70,7 +69,6 @@ async def update_character_status(
 ) -> None:
     """Update character training status in database."""
     async with async_session_maker() as session:
-        from sqlalchemy import select
         result = await session.execute(
             select(Character).where(Character.id == character_id)
         )
@@ -86,25 +84,54 @@ async def update_character_status(
             await session.commit()
 
 
+def _suffix(name: str) -> str:
+    """Lowercased file extension, without Path's parsing machinery."""
+    i = name.rfind(".")
+    return name[i:].lower() if i > 0 and len(name) - i <= 5 else ".png"
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 async def save_uploaded_images(
-    images: list[UploadFile],
+    image_keys: list[str],
     output_dir: Path,
-) -> list[Path]:
-    """Save uploaded images to a directory."""
-    saved_paths = []
+) -> tuple[list[str], bytes | None]:
+    """
+    Download training images from storage into a local directory.
+
+    Returns the saved paths plus the first image's bytes, so the caller
+    can upload a thumbnail without re-reading the file from disk.
+    """
+    # Each image is independent I/O; download them concurrently, bounded
+    # so ~20 multi-MB transfers don't exhaust connections or fds
+    semaphore = asyncio.Semaphore(8)
+    output_dir_str = str(output_dir)
+
+    async def _save_one(i: int, key: str) -> tuple[str, bytes | None]:
+        output_path = os.path.join(output_dir_str, f"{i:04d}{_suffix(key)}")
 
-    for i, image in enumerate(images):
-        ext = Path(image.filename or "image.png").suffix or ".png"
-        filename = f"{i:04d}{ext}"
-        output_path = output_dir / filename
+        async with semaphore:
+            content = await storage_manager.download(key)
+            # One threadpool dispatch; aiofiles would spawn a managed
+            # handle for what is a single small write
+            await asyncio.to_thread(_write_bytes, output_path, content)
 
-        async with aiofiles.open(output_path, "wb") as f:
-            content = await image.read()
-            await f.write(content)
+        return output_path, (content if i == 0 else None)
 
-        saved_paths.append(output_path)
+    tasks = [
+        asyncio.create_task(_save_one(i, key))
+        for i, key in enumerate(image_keys)
+    ]
+    results = await asyncio.gather(*tasks)
+    saved_paths = [path for path, _ in results]
+    first_bytes = results[0][1] if results else None
+    return saved_paths, first_bytes
 
-    return saved_paths
+
+_CAPTION_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
 
 
 def generate_captions(image_dir: Path, trigger_word: str) -> None:
@@ -112,14 +139,25 @@ def generate_captions(image_dir: Path, trigger_word: str) -> None:
     Generate caption files for training images.
 
     For LoRA training, each image needs a corresponding .txt file with the caption.
-    We use a simple pattern: trigger_word, description of the character
+    We use a simple pattern: trigger_word, description of the character.
+    The caption is identical for every image, so it is encoded once and
+    written with plain fd syscalls rather than a Path object per file.
     """
-    for image_path in image_dir.iterdir():
-        if image_path.suffix.lower() in [".png", ".jpg", ".jpeg", ".webp"]:
-            caption_path = image_path.with_suffix(".txt")
-            # Simple caption with trigger word
-            caption = f"{trigger_word}, a photo of a person"
-            caption_path.write_text(caption)
+    caption_bytes = f"{trigger_word}, a photo of a person".encode()
+
+    with os.scandir(image_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if entry.is_file() and ext.lower() in _CAPTION_EXTENSIONS:
+                fd = os.open(
+                    os.path.join(image_dir, stem + ".txt"),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0o644,
+                )
+                try:
+                    os.write(fd, caption_bytes)
+                finally:
+                    os.close(fd)
 
 
 def build_training_config(
@@ -161,17 +199,51 @@ def build_training_config(
     }
 
 
-async def run_training_subprocess(config: dict, work_dir: Path) -> Path:
+def _fast_materialize(src: Path, dst: Path) -> None:
+    """
+    Mirror src to dst without duplicating bytes where the filesystem allows.
+
+    Tries a hardlink first (zero-copy; the inode refcount keeps the data
+    alive after the training work_dir is rmtree'd), then an in-kernel
+    copy_file_range, then a plain shutil.copy as the last resort.
+    """
+    if dst.exists():
+        dst.unlink()
+
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        # Different filesystem (EXDEV) or hardlinks unsupported
+        pass
+
+    try:
+        remaining = os.stat(src).st_size
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        shutil.copy(src, dst)
+
+
+async def run_training_subprocess(
+    config: dict,
+    work_dir: Path,
+    extra_env: dict[str, str] | None = None,
+) -> Path:
     """
     Run the LoRA training process.
 
     This calls the training script (kohya_ss or similar) as a subprocess.
     In production on RunPod, this would be the actual training command.
+    extra_env entries (e.g. a presigned upload URL) are exported to it.
     """
     config_path = work_dir / "training_config.json"
 
-    import json
-    config_path.write_text(json.dumps(config, indent=2))
+    config_path.write_bytes(orjson.dumps(config))
 
     # The actual training command depends on your setup
     # This is a placeholder for the kohya_ss training command
@@ -180,39 +252,61 @@ async def run_training_subprocess(config: dict, work_dir: Path) -> Path:
         "python -m kohya_ss.train_network"
     )
 
-    cmd = f"{training_script} --config_file {config_path}"
+    # exec the argv directly - no /bin/sh fork, no shell injection surface
+    argv = shlex.split(training_script) + ["--config_file", str(config_path)]
 
-    process = await asyncio.create_subprocess_shell(
-        cmd,
+    process = await asyncio.create_subprocess_exec(
+        *argv,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
         cwd=str(work_dir),
+        env={**os.environ, **extra_env} if extra_env else None,
     )
 
-    stdout, stderr = await process.communicate()
+    # Stream the trainer log instead of buffering it: a multi-hour run can
+    # emit gigabytes of output, and communicate() would hold all of it in
+    # memory. Only a bounded tail of stderr is kept for the error message.
+    stderr_tail: deque[str] = deque(maxlen=200)
+
+    async def _pump(stream, tail: deque[str] | None) -> None:
+        async for raw_line in stream:
+            line = raw_line.decode(errors="replace").rstrip()
+            logger.info("training: %s", line)
+            if tail is not None:
+                tail.append(line)
+
+    stdout_task = asyncio.create_task(_pump(process.stdout, None))
+    stderr_task = asyncio.create_task(_pump(process.stderr, stderr_tail))
+    await asyncio.gather(stdout_task, stderr_task)
+    await process.wait()
 
     if process.returncode != 0:
-        error_msg = stderr.decode() if stderr else "Unknown training error"
+        error_msg = "\n".join(stderr_tail) or "Unknown training error"
         raise RuntimeError(f"Training failed: {error_msg}")
 
-    # Find the output LoRA file
-    output_dir = Path(config["output_dir"])
-    lora_files = list(output_dir.glob("*.safetensors"))
+    # Find the output LoRA file; scandir + sort gives a deterministic pick
+    # without the pattern-matching machinery of glob
+    with os.scandir(config["output_dir"]) as entries:
+        lora_files = sorted(
+            entry.path
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".safetensors")
+        )
 
     if not lora_files:
         raise RuntimeError("No LoRA file found after training")
 
-    return lora_files[0]
+    return Path(lora_files[0])
 
 
 async def start_lora_training(
     character_id: UUID,
-    images: list[UploadFile],
+    image_keys: list[str],
 ) -> None:
     """
     Main LoRA training pipeline.
 
-    1. Save uploaded images to temp directory
+    1. Download training images from storage to temp directory
     2. Generate captions for each image
     3. Run training
     4. Upload trained LoRA to storage
@@ -221,9 +315,10 @@ async def start_lora_training(
     work_dir = None
 
     try:
-        # Get character info
+        # Fetch the character and mark it TRAINING in one session - the
+        # separate update_character_status call re-SELECTed the row we
+        # already had, paying a second pool checkout and round trip
         async with async_session_maker() as session:
-            from sqlalchemy import select
             result = await session.execute(
                 select(Character).where(Character.id == character_id)
             )
@@ -235,7 +330,8 @@ async def start_lora_training(
             trigger_word = character.trigger_word
             character_name = character.name.replace(" ", "_").lower()
 
-        await update_character_status(character_id, CharacterStatus.TRAINING)
+            character.status = CharacterStatus.TRAINING.value
+            await session.commit()
 
         # Create working directory
         work_dir = Path(tempfile.mkdtemp(prefix=f"lora_training_{character_id}_"))
@@ -244,8 +340,8 @@ async def start_lora_training(
         output_dir = work_dir / "output"
         output_dir.mkdir()
 
-        # Save images
-        await save_uploaded_images(images, image_dir)
+        # Save images, keeping the first one's bytes for the thumbnail
+        saved_paths, first_image_bytes = await save_uploaded_images(image_keys, image_dir)
 
         # Generate captions
         generate_captions(image_dir, trigger_word)
@@ -258,37 +354,58 @@ async def start_lora_training(
             character_name=character_name,
         )
 
-        lora_path = await run_training_subprocess(config, work_dir)
+        # If the provider can presign uploads, hand the training process a
+        # direct PUT URL for the artifact so the bytes go straight from the
+        # training pod to storage instead of through this process
+        presigned_key = f"loras/{character_id}/lora_{character_name}.safetensors"
+        extra_env = None
+        presign = getattr(storage_manager.provider, "generate_presigned_put", None)
+        if presign is not None:
+            upload_url = await presign(
+                presigned_key, content_type="application/octet-stream"
+            )
+            extra_env = {"LORA_UPLOAD_URL": upload_url}
 
-        # Upload LoRA to storage
-        async with aiofiles.open(lora_path, "rb") as f:
-            lora_data = await f.read()
+        lora_path = await run_training_subprocess(config, work_dir, extra_env=extra_env)
 
+        # The LoRA upload (long network transfer, streamed from disk), the
+        # thumbnail upload (short network transfer), and the local mirror
+        # copy for ComfyUI (disk-only) are independent - run them together
         storage_path = f"loras/{character_id}/{lora_path.name}"
-        lora_url = await storage_manager.upload(
-            data=lora_data,
-            path=storage_path,
-            content_type="application/octet-stream",
-        )
-
-        # Copy LoRA to local models directory for ComfyUI access
         local_lora_path = Path(settings.lora_output_dir) / lora_path.name
         local_lora_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(lora_path, local_lora_path)
-
-        # Create thumbnail from first training image
-        thumbnail_url = None
-        first_image = next(image_dir.iterdir(), None)
-        if first_image and first_image.suffix.lower() in [".png", ".jpg", ".jpeg"]:
-            async with aiofiles.open(first_image, "rb") as f:
-                thumb_data = await f.read()
-            thumbnail_path = f"characters/{character_id}/thumbnail.png"
-            thumbnail_url = await storage_manager.upload(
-                data=thumb_data,
-                path=thumbnail_path,
-                content_type="image/png",
+
+        # Skip the upload when the training process already pushed the
+        # artifact through its presigned URL
+        uploaded_by_trainer = False
+        if extra_env is not None and storage_path == presigned_key:
+            exists = getattr(storage_manager.provider, "exists", None)
+            if exists is not None:
+                uploaded_by_trainer = await exists(storage_path)
+
+        has_thumbnail = bool(
+            first_image_bytes
+            and saved_paths
+            and saved_paths[0].endswith((".png", ".jpg", ".jpeg"))
+        )
+        upload_specs = []
+        if not uploaded_by_trainer:
+            upload_specs.append(UploadSpec(lora_path, storage_path))
+        if has_thumbnail:
+            upload_specs.append(
+                UploadSpec(
+                    first_image_bytes,
+                    f"characters/{character_id}/thumbnail.png",
+                    content_type="image/png",
+                )
             )
 
+        urls, _ = await asyncio.gather(
+            storage_manager.upload_many(upload_specs),
+            asyncio.to_thread(_fast_materialize, lora_path, local_lora_path),
+        )
+        thumbnail_url = urls[-1] if has_thumbnail else None
+
         await update_character_status(
             character_id,
             CharacterStatus.READY,
@@ -0,0 +1,90 @@
+"""
+arq worker for long-running jobs.
+
+LoRA training and ComfyUI generation run for minutes; executing them on the
+API event loop via BackgroundTasks starves request handling. This worker
+consumes jobs from the Redis queue in a separate process.
+
+Run with:
+    arq src.workers.worker.WorkerSettings
+"""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+import uvloop
+from arq.connections import RedisSettings
+from arq.worker import func
+
+from src.core.config import get_settings
+from src.core.database import async_session_maker
+from src.models.character import Character
+from src.schemas.generation import ImageGenerationRequest, VideoGenerationRequest
+from src.services.comfyui.image_generator import generate_image_task
+from src.services.comfyui.video_generator import generate_video_task
+from src.services.training.lora_trainer import start_lora_training
+
+settings = get_settings()
+
+# Install the libuv event loop before arq starts its loop; the worker is
+# all socket I/O (ComfyUI polling, storage uploads, DB updates)
+uvloop.install()
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    """Enable eager tasks (3.12+) on the worker loop."""
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+async def _load_character(character_id: UUID) -> Character:
+    """Load a character for a queued job."""
+    async with async_session_maker() as session:
+        character = await session.get(Character, character_id)
+        if not character:
+            raise RuntimeError(f"Character {character_id} not found")
+        return character
+
+
+async def train_lora(
+    ctx: dict[str, Any], character_id: str, image_keys: list[str]
+) -> None:
+    """Run the LoRA training pipeline for a character."""
+    await start_lora_training(UUID(character_id), image_keys)
+
+
+async def generate_image(
+    ctx: dict[str, Any], generation_id: str, character_id: str, request: dict[str, Any]
+) -> None:
+    """Run an image generation job."""
+    character = await _load_character(UUID(character_id))
+    await generate_image_task(
+        UUID(generation_id), character, ImageGenerationRequest(**request)
+    )
+
+
+async def generate_video(
+    ctx: dict[str, Any], generation_id: str, character_id: str, request: dict[str, Any]
+) -> None:
+    """Run a video generation job."""
+    character = await _load_character(UUID(character_id))
+    await generate_video_task(
+        UUID(generation_id), character, VideoGenerationRequest(**request)
+    )
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    # Training runs for hours; give it its own timeout instead of letting
+    # the default cancel it mid-run
+    functions = [
+        func(train_lora, timeout=12 * 3600),
+        generate_image,
+        generate_video,
+    ]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    max_jobs = 4
+    job_timeout = 3600  # generation jobs finish well within an hour
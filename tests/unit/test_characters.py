@@ -51,3 +51,87 @@ class TestTriggerWordGeneration:
 
         assert generate_trigger_word("Café!") == "sks_caf"
         assert generate_trigger_word("Test@#$123") == "sks_test123"
+
+
+class TestListCharactersPagination:
+    def _make_character(self, created_at):
+        from src.models.character import Character
+
+        return Character(
+            id=uuid4(),
+            name="Test",
+            description=None,
+            trigger_word=f"sks_{uuid4().hex[:8]}",
+            status="ready",
+            lora_path=None,
+            thumbnail_url=None,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    def _make_db(self, rows):
+        result = MagicMock()
+        result.all.return_value = rows
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    @pytest.mark.anyio
+    async def test_full_page_returns_next_cursor(self):
+        """A page of exactly `limit` rows points at the last row's created_at."""
+        from collections import namedtuple
+        from datetime import datetime, timedelta
+
+        from src.api.routes.characters import list_characters
+
+        Row = namedtuple("Row", ["character", "total"])
+        base = datetime(2026, 1, 1)
+        characters = [
+            self._make_character(base - timedelta(minutes=i)) for i in range(2)
+        ]
+        rows = [Row(c, 5) for c in characters]
+
+        response = await list_characters(MagicMock(), self._make_db(rows), limit=2)
+
+        assert response["total"] == 5
+        assert response["next_cursor"] == characters[-1].created_at
+        assert response["next_cursor_id"] == characters[-1].id
+        assert len(response["characters"]) == 2
+
+    @pytest.mark.anyio
+    async def test_short_page_has_no_next_cursor(self):
+        """Fewer rows than `limit` means the listing is exhausted."""
+        from collections import namedtuple
+        from datetime import datetime
+
+        from src.api.routes.characters import list_characters
+
+        Row = namedtuple("Row", ["character", "total"])
+        rows = [Row(self._make_character(datetime(2026, 1, 1)), 1)]
+
+        response = await list_characters(MagicMock(), self._make_db(rows), limit=100)
+
+        assert response["total"] == 1
+        assert response["next_cursor"] is None
+        assert response["next_cursor_id"] is None
+
+    @pytest.mark.anyio
+    async def test_cursor_page_uses_cached_total(self):
+        """Later pages take the total from the count cache, not the window count."""
+        from collections import namedtuple
+        from datetime import datetime, timedelta
+
+        from src.api.routes.characters import list_characters
+
+        Row = namedtuple("Row", ["character", "total"])
+        cursor = datetime(2026, 1, 2)
+        rows = [Row(self._make_character(cursor - timedelta(hours=1)), 1)]
+
+        request = MagicMock()
+        request.app.state.redis.get = AsyncMock(return_value="7")
+
+        response = await list_characters(
+            request, self._make_db(rows), cursor=cursor, limit=100
+        )
+
+        assert response["total"] == 7
@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.character import Character
+from src.schemas.generation import GenerationStatus, ImageGenerationRequest
+from src.services.comfyui.image_generator import compute_cache_key, generate_image_task
+
+
+def make_character() -> Character:
+    return Character(
+        id=uuid4(),
+        name="Test Character",
+        trigger_word="sks_test",
+        lora_path="/loras/lora_test.safetensors",
+    )
+
+
+class TestComputeCacheKey:
+    def test_unseeded_request_has_no_key(self):
+        """Random seeds make every run unique - nothing to deduplicate."""
+        request = ImageGenerationRequest(character_id=uuid4(), prompt="test")
+
+        assert compute_cache_key(make_character(), request) is None
+
+    def test_identical_inputs_same_key(self):
+        """The same character and parameters always hash to the same key."""
+        character = make_character()
+        kwargs = dict(character_id=character.id, prompt="a portrait", seed=42)
+
+        key_a = compute_cache_key(character, ImageGenerationRequest(**kwargs))
+        key_b = compute_cache_key(
+            character,
+            ImageGenerationRequest(seed=42, prompt="a portrait", character_id=character.id),
+        )
+
+        assert key_a == key_b
+        assert len(key_a) == 32  # blake2b digest_size=16, hex
+
+    def test_different_inputs_different_keys(self):
+        """Changing the seed or the character changes the key."""
+        character = make_character()
+        request = ImageGenerationRequest(
+            character_id=character.id, prompt="a portrait", seed=42
+        )
+        other_seed = ImageGenerationRequest(
+            character_id=character.id, prompt="a portrait", seed=43
+        )
+
+        assert compute_cache_key(character, request) != compute_cache_key(
+            character, other_seed
+        )
+        assert compute_cache_key(character, request) != compute_cache_key(
+            make_character(), request
+        )
+
+
+class TestInflightDedup:
+    @pytest.mark.anyio
+    async def test_duplicate_request_reuses_claimer_result(self):
+        """A task that loses the claim waits on the owner's row instead of running."""
+        character = make_character()
+        generation_id = uuid4()
+        request = ImageGenerationRequest(
+            character_id=character.id, prompt="a portrait", seed=42
+        )
+
+        mock_redis = AsyncMock()
+        mock_redis.set.return_value = False  # another task holds the claim
+        mock_redis.get.return_value = str(uuid4())
+
+        with (
+            patch(
+                "src.services.comfyui.image_generator._get_redis",
+                return_value=mock_redis,
+            ),
+            patch(
+                "src.services.comfyui.image_generator._cached_image_url",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "src.services.comfyui.image_generator._await_inflight",
+                AsyncMock(return_value="https://cdn/img.png"),
+            ),
+            patch(
+                "src.services.comfyui.image_generator.update_generation_status",
+                AsyncMock(),
+            ) as mock_update,
+        ):
+            await generate_image_task(generation_id, character, request)
+
+        mock_update.assert_awaited_once_with(
+            generation_id,
+            GenerationStatus.COMPLETED,
+            image_url="https://cdn/img.png",
+            cache_key=compute_cache_key(character, request),
+        )
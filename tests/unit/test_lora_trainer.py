@@ -81,3 +81,62 @@ class TestBuildTrainingConfig:
         # These come from settings
         assert "learning_rate" in config
         assert "max_train_steps" in config
+
+
+class TestSuffix:
+    def test_common_extensions_lowercased(self):
+        from src.services.training.lora_trainer import _suffix
+
+        assert _suffix("photo.PNG") == ".png"
+        assert _suffix("image.jpeg") == ".jpeg"
+        assert _suffix("archive.tar.gz") == ".gz"
+
+    def test_defaults_to_png(self):
+        from src.services.training.lora_trainer import _suffix
+
+        assert _suffix("noextension") == ".png"
+        assert _suffix(".hidden") == ".png"  # leading dot is not an extension
+        assert _suffix("weird.safetensors") == ".png"  # implausibly long ext
+
+
+class TestFastMaterialize:
+    def test_mirrors_file_contents(self, tmp_path):
+        from src.services.training.lora_trainer import _fast_materialize
+
+        src = tmp_path / "lora.safetensors"
+        src.write_bytes(b"weights")
+        dst = tmp_path / "mirror.safetensors"
+
+        _fast_materialize(src, dst)
+
+        assert dst.read_bytes() == b"weights"
+
+    def test_overwrites_existing_destination(self, tmp_path):
+        from src.services.training.lora_trainer import _fast_materialize
+
+        src = tmp_path / "lora.safetensors"
+        src.write_bytes(b"new weights")
+        dst = tmp_path / "mirror.safetensors"
+        dst.write_bytes(b"stale weights")
+
+        _fast_materialize(src, dst)
+
+        assert dst.read_bytes() == b"new weights"
+
+    def test_falls_back_to_copy_when_link_unsupported(self, tmp_path):
+        """Cross-device setups without copy_file_range still get a plain copy."""
+        import os
+
+        from src.services.training.lora_trainer import _fast_materialize
+
+        src = tmp_path / "lora.safetensors"
+        src.write_bytes(b"weights")
+        dst = tmp_path / "mirror.safetensors"
+
+        with (
+            patch.object(os, "link", side_effect=OSError),
+            patch.object(os, "copy_file_range", side_effect=OSError),
+        ):
+            _fast_materialize(src, dst)
+
+        assert dst.read_bytes() == b"weights"
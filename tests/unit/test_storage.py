@@ -1,18 +1,18 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 
 class TestS3StorageProvider:
     @pytest.fixture
     def s3_provider(self):
-        """Create S3 provider with mocked boto3."""
-        with patch("src.services.storage.s3_provider.boto3") as mock_boto3:
-            mock_client = MagicMock()
-            mock_boto3.client.return_value = mock_client
+        """Create S3 provider with mocked aioboto3."""
+        with patch("src.services.storage.s3_provider.aioboto3") as mock_aioboto3:
+            mock_client = AsyncMock()
+            mock_aioboto3.Session.return_value.client.return_value = mock_client
 
             from src.services.storage.s3_provider import S3StorageProvider
             provider = S3StorageProvider()
-            provider.client = mock_client
+            provider._client = mock_client
             return provider
 
     @pytest.mark.anyio
@@ -48,3 +48,59 @@ class TestStorageManager:
             provider = get_storage_provider()
 
             assert provider is not None
+
+
+class TestUploadMany:
+    @pytest.mark.anyio
+    async def test_results_preserve_input_order(self):
+        """URLs come back in spec order even when uploads finish out of order."""
+        import asyncio
+
+        from src.services.storage.manager import StorageManager, UploadSpec
+
+        async def upload(data, path, content_type):
+            # Make the first item finish last
+            await asyncio.sleep(0.02 if path == "a.png" else 0)
+            return f"https://cdn/{path}"
+
+        provider = AsyncMock()
+        provider.upload.side_effect = upload
+
+        with patch(
+            "src.services.storage.manager.get_storage_provider",
+            return_value=provider,
+        ):
+            urls = await StorageManager().upload_many(
+                [
+                    UploadSpec(b"a", "a.png"),
+                    UploadSpec(b"b", "b.png"),
+                    UploadSpec(b"c", "c.png"),
+                ]
+            )
+
+        assert urls == ["https://cdn/a.png", "https://cdn/b.png", "https://cdn/c.png"]
+
+    @pytest.mark.anyio
+    async def test_path_source_streams_from_disk(self, tmp_path):
+        """A Path source goes through the provider's upload_file, not upload."""
+        from pathlib import Path
+
+        from src.services.storage.manager import StorageManager, UploadSpec
+
+        local = tmp_path / "lora.safetensors"
+        local.write_bytes(b"weights")
+
+        provider = AsyncMock()
+        provider.upload_file.return_value = "https://cdn/lora.safetensors"
+
+        with patch(
+            "src.services.storage.manager.get_storage_provider",
+            return_value=provider,
+        ):
+            urls = await StorageManager().upload_many(
+                [UploadSpec(Path(local), "loras/lora.safetensors")]
+            )
+
+        assert urls == ["https://cdn/lora.safetensors"]
+        provider.upload_file.assert_awaited_once()
+        provider.upload.assert_not_awaited()